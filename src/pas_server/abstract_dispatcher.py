@@ -34,7 +34,8 @@ from dpt_settings import Settings
 from dpt_threading.instance_lock import InstanceLock
 from dpt_threading.thread import Thread
 
-from .controller import AbstractDispatchedConnection
+from .controller import AbstractAioConnection, AbstractDispatchedConnection, ConnectionSettings
+from .worker_pool import WorkerPool
 
 class AbstractDispatcher(object):
     """
@@ -53,18 +54,24 @@ and communication.
     # pylint: disable=unused-argument
 
     __slots__ = [ "__weakref__",
+                  "_accept_batch_max",
                   "_active",
                   "_active_connection_class",
-                  "_actives_list",
+                  "_actives",
                   "_backlog_max",
+                  "_connection_settings",
+                  "_datagram_concurrent",
+                  "_datagram_peer_ordered",
                   "_listener_handle_connections",
                   "_listener_socket",
                   "_listener_startup_timeout",
                   "local",
                   "_lock",
                   "_log_handler",
+                  "_socket_profile",
                   "stopping_hook",
-                  "thread"
+                  "thread",
+                  "_worker_pool"
                 ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
@@ -78,27 +85,51 @@ Constructor __init__(AbstractDispatcher)
 :param listener_socket: Listener socket
 :param active_connection_class: Thread class to be initialized for activated connections
 :param threads_active: Allowed simultaneous threads
-:param backlog_max: Allowed queued threads
+:param backlog_max: Allowed queued connections waiting for a thread
 :param thread_stopping_hook: Thread stopping hook definition
 
 :since: v1.0.0
         """
 
+        self._accept_batch_max = int(Settings.get("pas_global_server_accept_batch_size", 16))
+        """
+Maximum number of connections accepted per listener readiness event
+        """
         self._active = False
         """
 Listener state
         """
-        self._active_connection_class = (active_connection_class if (issubclass(active_connection_class, AbstractDispatchedConnection)) else None)
+        self._active_connection_class = (active_connection_class
+                                         if (issubclass(active_connection_class, ( AbstractAioConnection, AbstractDispatchedConnection ))) else
+                                         None
+                                        )
         """
 Active queue connection class
         """
-        self._actives_list = [ ]
+        self._actives = { }
         """
-Active queue
+Active sockets registry keyed by the socket instance ID
         """
         self._backlog_max = backlog_max
         """
 Maximum sockets in backlog
+        """
+        self._connection_settings = (self._active_connection_class.load_settings()
+                                     if (self._active_connection_class is not None
+                                         and issubclass(self._active_connection_class, AbstractDispatchedConnection)
+                                        ) else
+                                     None
+                                    )
+        """
+Settings read once for all dispatched connections activated
+        """
+        self._datagram_concurrent = ConnectionSettings.is_setting_enabled("pas_global_server_datagram_concurrent")
+        """
+True to process received datagrams concurrently by the worker pool
+        """
+        self._datagram_peer_ordered = ConnectionSettings.is_setting_enabled("pas_global_server_datagram_peer_ordered")
+        """
+True to process concurrent datagrams of the same peer in the order received
         """
         self._listener_handle_connections = (listener_socket.type & socket.SOCK_STREAM)
         """
@@ -124,6 +155,10 @@ Thread safety lock
         """
 The log handler is called whenever debug messages should be logged or errors
 happened.
+        """
+        self._socket_profile = AbstractDispatcher._get_socket_profile()
+        """
+Socket options applied to accepted sockets
         """
         self.stopping_hook = ("" if (thread_stopping_hook is None) else thread_stopping_hook)
         """
@@ -133,10 +168,28 @@ Stopping hook definition
         """
 Thread if started and active
         """
+        self._worker_pool = WorkerPool(threads_active, backlog_max, AbstractDispatcher._get_backlog_overflow_policy())
+        """
+Worker pool executing activated connections queued up to the backlog size
+        """
+
+        if (self._accept_batch_max < 1): self._accept_batch_max = 1
 
         self.log_handler = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
     #
 
+    @property
+    def connection_settings(self):
+        """
+Returns the settings read once for all dispatched connections activated.
+
+:return: (dict) Connection settings; None if not applicable
+:since:  v1.1.0
+        """
+
+        return self._connection_settings
+    #
+
     @property
     def is_active(self):
         """
@@ -174,6 +227,32 @@ Sets the log handler.
         self._log_handler = (log_handler if (isinstance(log_handler, ProxyTypes)) else proxy(log_handler))
     #
 
+    @property
+    def socket_profile(self):
+        """
+Returns the socket options applied to accepted sockets.
+
+:return: (dict) Socket profile
+:since:  v1.1.0
+        """
+
+        return self._socket_profile
+    #
+
+    @socket_profile.setter
+    def socket_profile(self, socket_profile):
+        """
+Sets the socket profile applied to accepted sockets.
+
+:param socket_profile: Socket profile dict or name of a socket profile
+                       configured
+
+:since: v1.1.0
+        """
+
+        self._socket_profile = AbstractDispatcher._get_socket_profile(socket_profile)
+    #
+
     def _activate_connection(self, _socket):
         """
 Initializes the active connection class with the given socket.
@@ -183,15 +262,50 @@ Initializes the active connection class with the given socket.
 :since: v1.0.0
         """
 
+        if (self._listener_handle_connections): self._apply_accepted_socket_profile(_socket)
+
         connection = self._active_connection_class()
         connection.init_from_dispatcher(self, _socket)
 
         if (isinstance(connection, Thread)):
-            connection.start()
-            if (_socket.type == socket.SOCK_DGRAM): connection.join()
+            if (_socket.type == socket.SOCK_DGRAM): connection.run()
+            elif (not self._worker_pool.submit(connection.run, connection.finish)):
+                if (self._log_handler is not None): self._log_handler.debug("{0!r} rejected '{1!r}' with backlog exhausted", self, connection, context = "pas_server")
+                connection = None
+            #
+        else: connection.handle()
+
+        if (connection is not None and self._log_handler is not None): self._log_handler.debug("{0!r} started '{1!r}'", self, connection, context = "pas_server")
+    #
+
+    def _activate_datagram_connection(self, _socket, data, address):
+        """
+Initializes the active connection class with the given datagram already
+received from the socket.
+
+:param _socket: Active socket resource
+:param data: Datagram data received
+:param address: Raw client socket address
+
+:since: v1.1.0
+        """
+
+        connection = self._active_connection_class()
+        connection.init_from_dispatcher_datagram(self, _socket, data, address)
+
+        if (isinstance(connection, Thread)):
+            if (not self._datagram_concurrent): connection.run()
+            elif (not self._worker_pool.submit(connection.run,
+                                               connection.finish,
+                                               (address if (self._datagram_peer_ordered) else None)
+                                              )
+                 ):
+                if (self._log_handler is not None): self._log_handler.debug("{0!r} rejected '{1!r}' with backlog exhausted", self, connection, context = "pas_server")
+                connection = None
+            #
         else: connection.handle()
 
-        if (self._log_handler is not None): self._log_handler.debug("{0!r} started '{1!r}'", self, connection, context = "pas_server")
+        if (connection is not None and self._log_handler is not None): self._log_handler.debug("{0!r} started '{1!r}'", self, connection, context = "pas_server")
     #
 
     def _add_active_socket(self, _socket):
@@ -210,7 +324,7 @@ Put's an socket on the list of active connections.
             with self._lock:
                 # Thread safety lock
                 if (self.is_active):
-                    self._actives_list.append(_socket)
+                    self._actives[id(_socket)] = _socket
                     _return = True
                 #
             #
@@ -219,6 +333,26 @@ Put's an socket on the list of active connections.
         return _return
     #
 
+    def _apply_accepted_socket_profile(self, _socket):
+        """
+Applies the socket options of the socket profile relevant for accepted
+connections to the given socket.
+
+:param _socket: Accepted socket
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (len(self._socket_profile) > 0 and _socket.family in ( socket.AF_INET, socket.AF_INET6 )):
+            try: AbstractDispatcher._apply_socket_profile(_socket, self._socket_profile, False)
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.warning(handled_exception, context = "pas_server")
+            #
+        #
+    #
+
     def _ensure_thread_local(self):
         """
 For thread safety some variables are defined per thread. This method makes
@@ -243,6 +377,25 @@ Initializes the dispatcher and stopping hook.
             stopping_hook = ("pas.Application.onShutdown" if (self.stopping_hook == "") else self.stopping_hook)
             Hook.register_weakref(stopping_hook, self.thread_stop)
         #
+
+        if ((self._listener_handle_connections or self._datagram_concurrent)
+            and (not issubclass(self._active_connection_class, AbstractAioConnection))
+           ): self._worker_pool.start()
+    #
+
+    def _receive_datagram(self):
+        """
+Receives the next datagram from the datagram listener socket.
+
+:return: (tuple) Datagram data and raw client socket address; None if no
+         datagram is available
+:since:  v1.1.0
+        """
+
+        try: _return = self._listener_socket.recvfrom(65535)
+        except ( BlockingIOError, InterruptedError ): _return = None
+
+        return _return
     #
 
     def _remove_active_socket(self, _socket):
@@ -255,21 +408,12 @@ Removes the given socket from the list of active connections.
 :since:  v1.0.0
         """
 
-        _return = False
-
-        self._lock.acquire()
-
-        if (self._actives_list is not None and _socket in self._actives_list):
-            self._actives_list.remove(_socket)
-            self._lock.release()
+        with self._lock: _return = (self._actives.pop(id(_socket), None) is not None)
 
-            _return = True
-
-            if (self._listener_handle_connections):
-                try: _socket.close()
-                except socket.error: pass
-            #
-        else: self._lock.release()
+        if (_return and self._listener_handle_connections):
+            try: _socket.close()
+            except socket.error: pass
+        #
 
         return _return
     #
@@ -295,8 +439,14 @@ Unqueue all entries from the active queue (canceling running processes).
         """
 
         with self._lock:
-            if (self._actives_list is not None):
-                for _socket in self._actives_list: self._remove_active_socket(_socket)
+            sockets = list(self._actives.values())
+            self._actives.clear()
+        #
+
+        if (self._listener_handle_connections):
+            for _socket in sockets:
+                try: _socket.close()
+                except socket.error: pass
             #
         #
     #
@@ -362,12 +512,94 @@ Stops the running dispatcher instance by a stopping hook call.
     #
 
     @staticmethod
-    def prepare_socket(listener_type, *listener_data):
+    def _apply_socket_profile(_socket, socket_profile, is_listener):
+        """
+Applies the options defined in the given socket profile to the socket.
+Options not supported by the platform are ignored.
+
+:param _socket: Socket to apply the options to
+:param socket_profile: Socket profile dict
+:param is_listener: True to apply the options relevant for listener sockets
+
+:since: v1.1.0
+        """
+
+        options = [ ( "tcp_nodelay", socket.IPPROTO_TCP, "TCP_NODELAY" ),
+                    ( "keepalive", socket.SOL_SOCKET, "SO_KEEPALIVE" ),
+                    ( "keepalive_idle", socket.IPPROTO_TCP, ("TCP_KEEPIDLE" if (hasattr(socket, "TCP_KEEPIDLE")) else "TCP_KEEPALIVE") ),
+                    ( "keepalive_interval", socket.IPPROTO_TCP, "TCP_KEEPINTVL" ),
+                    ( "keepalive_count", socket.IPPROTO_TCP, "TCP_KEEPCNT" )
+                  ]
+
+        if (is_listener):
+            options += [ ( "receive_buffer_size", socket.SOL_SOCKET, "SO_RCVBUF" ),
+                         ( "send_buffer_size", socket.SOL_SOCKET, "SO_SNDBUF" ),
+                         ( "tcp_defer_accept", socket.IPPROTO_TCP, "TCP_DEFER_ACCEPT" ),
+                         ( "tcp_fastopen", socket.IPPROTO_TCP, "TCP_FASTOPEN" )
+                       ]
+        else: options.append(( "tcp_quickack", socket.IPPROTO_TCP, "TCP_QUICKACK" ))
+
+        for ( key, level, option_name ) in options:
+            value = socket_profile.get(key)
+
+            if (value is not None and hasattr(socket, option_name)):
+                _socket.setsockopt(level, getattr(socket, option_name), int(value))
+            #
+        #
+    #
+
+    @staticmethod
+    def _get_backlog_overflow_policy():
+        """
+Returns the worker pool overflow policy configured for a full backlog.
+
+:return: (int) Worker pool overflow policy
+:since:  v1.1.0
+        """
+
+        overflow_policy = Settings.get("pas_global_server_backlog_overflow_policy", "reject")
+
+        if (overflow_policy == "block"): _return = WorkerPool.OVERFLOW_BLOCK
+        elif (overflow_policy == "drop_oldest"): _return = WorkerPool.OVERFLOW_DROP_OLDEST
+        else: _return = WorkerPool.OVERFLOW_REJECT
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_socket_profile(socket_profile = None):
+        """
+Returns the socket profile for the given name. Options configured with
+"pas_global_server_socket_profile" are used as defaults for the ones of a
+named profile configured with "pas_global_server_socket_profile_<name>".
+
+:param socket_profile: Socket profile dict or name; None for the default
+                       one
+
+:return: (dict) Socket profile
+:since:  v1.1.0
+        """
+
+        if (isinstance(socket_profile, dict)): _return = socket_profile
+        else:
+            _return = dict(Settings.get("pas_global_server_socket_profile", { }))
+            if (socket_profile is not None): _return.update(Settings.get("pas_global_server_socket_profile_{0}".format(socket_profile), { }))
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def prepare_socket(listener_type, *listener_data, reuse_port = False, socket_profile = None):
         """
 Prepare socket returns a bound socket for the given listener data.
 
 :param listener_type: Listener type
 :param listener_data: Listener data
+:param reuse_port: True to allow other sockets to bind the same address
+                   and port with "SO_REUSEPORT"
+:param socket_profile: Socket profile dict or name of a socket profile
+                       configured; None for the default one
 
 :since: v1.0.0
         """
@@ -380,6 +612,14 @@ Prepare socket returns a bound socket for the given listener data.
             _return = socket.socket(listener_type, socket.SOCK_STREAM)
             _return.setblocking(0)
             if (hasattr(socket, "SO_REUSEADDR")): _return.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            if (reuse_port):
+                if (not hasattr(socket, "SO_REUSEPORT")): raise IOException("Socket option SO_REUSEPORT is not supported on this platform")
+                _return.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            #
+
+            AbstractDispatcher._apply_socket_profile(_return, AbstractDispatcher._get_socket_profile(socket_profile), True)
+
             _return.bind(listener_data)
         elif (listener_type == socket.AF_UNIX):
             unixsocket_path_name = path.normpath(Binary.str(listener_data[0]))
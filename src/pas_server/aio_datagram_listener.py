@@ -19,9 +19,9 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 from socket import SOCK_DGRAM
 
-from dpt_runtime.descriptor_selector import DescriptorSelector
 from dpt_runtime.exception_log_trap import ExceptionLogTrap
 from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
 
 class AioDatagramListener(object):
     """
@@ -39,7 +39,7 @@ incoming datagrams.
 
     # pylint: disable=unused-argument
 
-    __slots__ = [ "_dispatcher", "_socket" ]
+    __slots__ = [ "_batch_max", "_buffer", "_dispatcher", "_socket" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -57,6 +57,14 @@ Constructor __init__(AioDatagramProtocol)
 
         if (listener_socket.type != SOCK_DGRAM): raise IOException("Socket given is not configured for datagrams")
 
+        self._batch_max = int(Settings.get("pas_global_server_datagram_batch_size", 32))
+        """
+Maximum number of datagrams received per read availability event
+        """
+        self._buffer = memoryview(bytearray(65535))
+        """
+Preallocated receive buffer
+        """
         self._dispatcher = dispatcher
         """
 "asyncio" based dispatcher instance
@@ -96,18 +104,30 @@ Called to configure the socket for the event loop reader.
 :since: v1.0.0
         """
 
-        with ExceptionLogTrap("pas_server"): self._dispatcher.event_loop.add_reader(self._socket.fileno(), self.handle_read)
+        with ExceptionLogTrap("pas_server"):
+            self._socket.setblocking(False)
+            self._dispatcher.event_loop.add_reader(self._socket.fileno(), self.handle_read)
+        #
     #
 
     def handle_read(self):
         """
-Callback for the read availability watched file descriptor.
+Callback for the read availability watched file descriptor. Up to
+"pas_global_server_datagram_batch_size" datagrams are received and handed
+to the dispatcher as a batch.
 
 :since: v1.0.0
         """
 
-        if (len(DescriptorSelector([ self._socket.fileno() ]).select(0)[0]) > 0):
-            self._dispatcher.handle_connection(self._socket)
+        datagrams = [ ]
+
+        while (len(datagrams) < self._batch_max):
+            try: ( data_size, address ) = self._socket.recvfrom_into(self._buffer)
+            except ( BlockingIOError, InterruptedError ): break
+
+            datagrams.append(( self._buffer[:data_size].tobytes(), address ))
         #
+
+        if (len(datagrams) > 0): self._dispatcher.handle_datagrams(self._socket, datagrams)
     #
 #
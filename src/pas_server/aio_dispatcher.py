@@ -29,6 +29,7 @@ from dpt_threading.thread import Thread
 from .abstract_dispatcher import AbstractDispatcher
 from .aio_datagram_listener import AioDatagramListener
 from .aio_protocol import AioProtocol
+from .controller import AbstractAioConnection
 from .shutdown_exception import ShutdownException
 
 class AioDispatcher(AbstractDispatcher):
@@ -113,6 +114,79 @@ Handles incoming connections
         #
     #
 
+    def handle_aio_connection(self, connection):
+        """
+Handles incoming connections of a native "asyncio" connection instance by
+scheduling its "handle()" coroutine.
+
+:param connection: "asyncio" connection instance
+
+:return: (bool) True if accepted
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = False
+
+        try:
+            if (self._add_active_socket(connection)):
+                self._apply_accepted_socket_profile(connection.socket)
+                self._event_loop.create_task(connection.handle())
+                _return = True
+
+                if (self._log_handler is not None): self._log_handler.debug("{0!r} started '{1!r}'", self, connection, context = "pas_server")
+            #
+        except Exception as handled_exception:
+            if (self._log_handler is None): TracedException.print_current_stack_trace()
+            else: self._log_handler.error(handled_exception, context = "pas_server")
+        #
+
+        return _return
+    #
+
+    def handle_datagrams(self, _socket, datagrams):
+        """
+Handles a batch of datagrams received from the given socket.
+
+:param _socket: Active socket resource
+:param datagrams: List of datagram data and client address tuples
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        for ( data, address ) in datagrams:
+            try:
+                if (self._add_active_socket(_socket)): self._activate_datagram_connection(_socket, data, address)
+            except ShutdownException as handled_exception:
+                exception = handled_exception.cause
+
+                if (exception is None and self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                else: handled_exception.print_stack_trace()
+            except Exception as handled_exception:
+                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+        #
+    #
+
+    def _new_aio_connection(self):
+        """
+Protocol factory callable returning a new native "asyncio" connection
+instance.
+
+:return: (object) "asyncio" connection instance
+:since:  v1.1.0
+        """
+
+        connection = self._active_connection_class()
+        connection.init_from_dispatcher(self)
+
+        return connection
+    #
+
     def run(self):
         """
 Run the main loop for this server instance.
@@ -192,14 +266,20 @@ Try to start processing data for the prepared socket.
 :since: v1.0.0
         """
 
-        if (self._listener_socket.type == SOCK_DGRAM): self._datagram_listener = AioDatagramListener(self, self._listener_socket)
+        is_aio_connection = issubclass(self._active_connection_class, AbstractAioConnection)
+
+        if (self._listener_socket.type == SOCK_DGRAM):
+            if (is_aio_connection): raise IOException("Native asyncio connections can not be used for datagram listeners")
+            self._datagram_listener = AioDatagramListener(self, self._listener_socket)
         else:
             awaitable_callable = (self._event_loop.create_unix_server
                                   if (self._listener_socket.family == AF_UNIX) else
                                   self._event_loop.create_server
                                  )
 
-            await awaitable_callable(AioProtocol(self), sock = self._listener_socket, backlog =self._backlog_max)
+            protocol_factory = (self._new_aio_connection if (is_aio_connection) else AioProtocol(self))
+
+            await awaitable_callable(protocol_factory, sock = self._listener_socket, backlog =self._backlog_max)
         #
     #
 
@@ -230,6 +310,7 @@ Stops the listener and unqueues all running sockets.
             self._lock.release()
 
             self._remove_all_sockets()
+            self._worker_pool.stop()
 
             try:
                 if (self._listener_socket.family == AF_UNIX):
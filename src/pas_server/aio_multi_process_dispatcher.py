@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from multiprocessing.connection import wait
+from weakref import proxy, ProxyTypes
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from dpt_module_loader import NamedClassLoader
+from dpt_plugins import Hook
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.traced_exception import TracedException
+from dpt_settings import Settings
+from dpt_threading.instance_lock import InstanceLock
+from dpt_threading.thread import Thread
+
+from .abstract_dispatcher import AbstractDispatcher
+from .aio_dispatcher import AioDispatcher
+from .shutdown_exception import ShutdownException
+
+class AioMultiProcessDispatcher(object):
+    """
+The multi-process dispatcher supervises a number of worker processes each
+running an "AioDispatcher" instance. Every worker binds its own listener
+socket with "SO_REUSEPORT" so that the kernel distributes incoming
+connections between them.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=unused-argument
+
+    __slots__ = [ "__weakref__",
+                  "_active",
+                  "_active_connection_class",
+                  "_backlog_max",
+                  "_listener_data",
+                  "_listener_type",
+                  "_lock",
+                  "_log_handler",
+                  "_process_context",
+                  "_processes",
+                  "_processes_max",
+                  "_restart_delay",
+                  "_shutdown_timeout",
+                  "stopping_hook",
+                  "_supervisor_pid",
+                  "_threads_active"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, listener_type, listener_data, active_connection_class, processes = None, threads_active = 5, backlog_max = 50, thread_stopping_hook = None):
+        """
+Constructor __init__(AioMultiProcessDispatcher)
+
+:param listener_type: Listener type
+:param listener_data: Listener data given to "prepare_socket()"
+:param active_connection_class: Thread class to be initialized for activated connections
+:param processes: Number of worker processes; None for the number of CPUs
+:param threads_active: Allowed simultaneous threads per worker process
+:param backlog_max: Allowed queued connections per worker process
+:param thread_stopping_hook: Thread stopping hook definition
+
+:since: v1.1.0
+        """
+
+        if (listener_type != socket.AF_INET and listener_type != socket.AF_INET6):
+            raise IOException("Multi-process dispatching requires an IPv4 or IPv6 listener")
+        #
+
+        if (not hasattr(socket, "SO_REUSEPORT")): raise IOException("Socket option SO_REUSEPORT is not supported on this platform")
+        if ("fork" not in multiprocessing.get_all_start_methods()): raise IOException("Multi-process dispatching requires the \"fork\" start method")
+
+        if (processes is None): processes = int(Settings.get("pas_global_server_processes", 0))
+        if (processes < 1): processes = (os.cpu_count() or 1)
+
+        self._active = False
+        """
+Supervisor state
+        """
+        self._active_connection_class = active_connection_class
+        """
+Active queue connection class
+        """
+        self._backlog_max = backlog_max
+        """
+Maximum sockets in backlog per worker process
+        """
+        self._listener_data = tuple(listener_data)
+        """
+Listener data
+        """
+        self._listener_type = listener_type
+        """
+Listener type
+        """
+        self._lock = InstanceLock()
+        """
+Thread safety lock
+        """
+        self._log_handler = None
+        """
+The log handler is called whenever debug messages should be logged or errors
+happened.
+        """
+        self._process_context = multiprocessing.get_context("fork")
+        """
+"multiprocessing" context used to start worker processes. Workers are
+forked to inherit the settings and hooks registered in the supervisor.
+        """
+        self._processes = [ ]
+        """
+Worker processes and their start time
+        """
+        self._processes_max = processes
+        """
+Number of worker processes
+        """
+        self._restart_delay = float(Settings.get("pas_global_server_process_restart_delay", 1))
+        """
+Minimum lifetime of a worker process before it is restarted without delay
+        """
+        self._shutdown_timeout = float(Settings.get("pas_global_server_process_shutdown_timeout", 10))
+        """
+Time in seconds worker processes are given to shut down gracefully before
+they are killed
+        """
+        self.stopping_hook = ("" if (thread_stopping_hook is None) else thread_stopping_hook)
+        """
+Stopping hook definition
+        """
+        self._supervisor_pid = None
+        """
+Process ID of the supervisor
+        """
+        self._threads_active = threads_active
+        """
+Allowed simultaneous threads per worker process
+        """
+
+        self.log_handler = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+    #
+
+    @property
+    def is_active(self):
+        """
+Returns the supervisor status.
+
+:return: (bool) True if active
+:since:  v1.1.0
+        """
+
+        return self._active
+    #
+
+    @property
+    def log_handler(self):
+        """
+Returns the log handler.
+
+:return: (object) Log handler in use
+:since:  v1.1.0
+        """
+
+        return self._log_handler
+    #
+
+    @log_handler.setter
+    def log_handler(self, log_handler):
+        """
+Sets the log handler.
+
+:param log_handler: Log handler to use
+
+:since: v1.1.0
+        """
+
+        self._log_handler = (log_handler if (isinstance(log_handler, ProxyTypes)) else proxy(log_handler))
+    #
+
+    def _init(self):
+        """
+Initializes the supervisor and stopping hook.
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}._init()- (#echo(__LINE__)#)", self, context = "pas_server")
+
+        if (self.stopping_hook is not None):
+            stopping_hook = ("pas.Application.onShutdown" if (self.stopping_hook == "") else self.stopping_hook)
+            Hook.register_weakref(stopping_hook, self.thread_stop)
+        #
+    #
+
+    def _restart_stopped_processes(self):
+        """
+Restarts worker processes that exited while the supervisor is active.
+
+:since: v1.1.0
+        """
+
+        restart_delay = 0
+        stopped_indices = [ ]
+
+        with self._lock:
+            if (self.is_active):
+                for index, ( process, started_time ) in enumerate(self._processes):
+                    if (not process.is_alive()):
+                        process.join()
+
+                        if (self._log_handler is not None): self._log_handler.warning("{0!r} restarts worker process {1:d} exited with code {2!r}", self, process.pid, process.exitcode, context = "pas_server")
+
+                        if (time.time() - started_time < self._restart_delay): restart_delay = self._restart_delay
+                        stopped_indices.append(index)
+                    #
+                #
+            #
+        #
+
+        if (len(stopped_indices) > 0):
+            if (restart_delay > 0): time.sleep(restart_delay)
+
+            with self._lock:
+                if (self.is_active):
+                    for index in stopped_indices: self._processes[index] = self._start_process()
+                #
+            #
+        #
+    #
+
+    def run(self):
+        """
+Run the supervising main loop for this server instance.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.run()- (#echo(__LINE__)#)", self, context = "pas_server")
+
+        if (not self.is_active):
+            with self._lock:
+                # Thread safety
+                if (self.is_active): raise IOException("pas.server.Dispatcher has been executed multiple times")
+                self._active = True
+            #
+        #
+
+        self._supervisor_pid = os.getpid()
+
+        try:
+            self._init()
+
+            with self._lock:
+                for _ in range(0, self._processes_max): self._processes.append(self._start_process())
+            #
+
+            while (self.is_active):
+                wait([ process.sentinel for ( process, _ ) in self._processes ], 5)
+                self._restart_stopped_processes()
+            #
+        except ShutdownException as handled_exception:
+            if (self.is_active):
+                exception = handled_exception.cause
+                if (exception is not None and self._log_handler is not None): self._log_handler.error(exception, context = "pas_server")
+            #
+        except Exception as handled_exception:
+            if (self.is_active):
+                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+        finally: self.stop()
+    #
+
+    def start(self):
+        """
+Starts the prepared supervisor in a new thread.
+
+:since: v1.1.0
+        """
+
+        if (not self.is_active):
+            is_already_active = False
+
+            with self._lock:
+                # Thread safety
+                is_already_active = self.is_active
+                if (not is_already_active): self._active = True
+            #
+
+            if (not is_already_active):
+                Thread(target = self.run).start()
+            #
+        #
+    #
+
+    def _start_process(self):
+        """
+Starts a new worker process.
+
+:return: (tuple) Worker process and its start time
+:since:  v1.1.0
+        """
+
+        process = self._process_context.Process(target = AioMultiProcessDispatcher._run_process,
+                                                args = ( self._listener_type,
+                                                         self._listener_data,
+                                                         self._active_connection_class,
+                                                         self._threads_active,
+                                                         self._backlog_max,
+                                                         self.stopping_hook
+                                                       )
+                                               )
+
+        process.start()
+
+        if (self._log_handler is not None): self._log_handler.debug("{0!r} started worker process {1:d}", self, process.pid, context = "pas_server")
+
+        return ( process, time.time() )
+    #
+
+    def stop(self):
+        """
+Stops the supervisor and all worker processes.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        self._lock.acquire()
+
+        if (self.is_active and self._supervisor_pid == os.getpid()):
+            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.stop()- (#echo(__LINE__)#)", self, context = "pas_server")
+
+            self._active = False
+
+            if (self.stopping_hook is not None and len(self.stopping_hook) > 0): Hook.unregister(self.stopping_hook, self.thread_stop)
+            self.stopping_hook = ""
+
+            processes = self._processes
+            self._processes = [ ]
+
+            self._lock.release()
+
+            for ( process, _ ) in processes:
+                try:
+                    if (process.is_alive()): process.terminate()
+                except Exception: pass
+            #
+
+            timeout_time = (time.time() + self._shutdown_timeout)
+
+            for ( process, _ ) in processes: process.join(max(0, timeout_time - time.time()))
+
+            for ( process, _ ) in processes:
+                if (process.is_alive()):
+                    process.kill()
+                    process.join()
+                #
+            #
+        else: self._lock.release()
+    #
+
+    def thread_start(self, params = None, last_return = None):
+        """
+Starts the prepared supervisor instance.
+
+:param params: Parameter specified
+:param last_return: The return value from the last hook called.
+
+:return: (mixed) Return value
+:since:  v1.1.0
+        """
+
+        self.start()
+        return (True if (last_return is None) else last_return)
+    #
+
+    def thread_stop(self, params = None, last_return = None):
+        """
+Stops the running supervisor instance by a stopping hook call.
+
+:param params: Parameter specified
+:param last_return: The return value from the last hook called.
+
+:return: (mixed) Return value
+:since:  v1.1.0
+        """
+
+        self.stop()
+        return last_return
+    #
+
+    @staticmethod
+    def _run_process(listener_type, listener_data, active_connection_class, threads_active, backlog_max, thread_stopping_hook):
+        """
+Worker process entry point binding the listener and running the
+"AioDispatcher".
+
+:param listener_type: Listener type
+:param listener_data: Listener data given to "prepare_socket()"
+:param active_connection_class: Thread class to be initialized for activated connections
+:param threads_active: Allowed simultaneous threads
+:param backlog_max: Allowed queued connections
+:param thread_stopping_hook: Thread stopping hook definition
+
+:since: v1.1.0
+        """
+
+        listener_socket = AbstractDispatcher.prepare_socket(listener_type, *listener_data, reuse_port = True)
+        dispatcher = AioDispatcher(listener_socket, active_connection_class, threads_active, backlog_max, thread_stopping_hook)
+
+        def shutdown():
+            Hook.call("pas.Application.onShutdown")
+            dispatcher.stop()
+        #
+
+        def handle_signal(signal_number, frame):
+            thread = Thread(target = shutdown)
+            thread.daemon = True
+            thread.start()
+        #
+
+        signal.signal(signal.SIGTERM, handle_signal)
+        if (hasattr(signal, "SIGINT")): signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        dispatcher.run()
+    #
+#
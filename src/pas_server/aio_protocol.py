@@ -82,11 +82,17 @@ python.org: Called when a connection is made.
         """
 
         async_socket = transport.get_extra_info("socket")
-        if (async_socket is None or (not hasattr(async_socket, "detach"))): raise IOException("asyncio transport does not provide an detachable underlying socket")
+        if (async_socket is None): raise IOException("asyncio transport does not provide an underlying socket")
 
         fd = async_socket.fileno()
         socket = fromfd(fd, async_socket.family, async_socket.type, async_socket.proto)
-        async_socket.detach()
+
+        if (hasattr(async_socket, "detach")): async_socket.detach()
+        else:
+            # Python 3.8+ wraps the socket and the duplicated one is used instead
+            transport.pause_reading()
+            transport.abort()
+        #
 
         self._dispatcher.handle_connection(socket)
     #
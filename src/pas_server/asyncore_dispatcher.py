@@ -86,6 +86,9 @@ python.org: Called on listening channels (passive openers) when a connection
 can be established with a new remote endpoint that has issued a connect()
 call for the local endpoint.
 
+Up to "pas_global_server_accept_batch_size" pending connections are
+accepted per call.
+
 Deprecated since version 3.2.
 
 :since: v1.0.0
@@ -93,16 +96,22 @@ Deprecated since version 3.2.
 
         # pylint: disable=broad-except
 
-        if (self.is_active and self._listener_handle_connections):
+        accepted_count = 0
+
+        while (self.is_active and self._listener_handle_connections and accepted_count < self._accept_batch_max):
             socket_data = None
 
             try: socket_data = self.accept()
             except Exception as handled_exception:
-                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                if (not self.is_active): pass
+                elif (self._log_handler is None): TracedException.print_current_stack_trace()
                 else: self._log_handler.error(handled_exception, context = "pas_server")
             #
 
-            if (socket_data is not None): self.handle_accepted(socket_data[0], socket_data[1])
+            if (socket_data is None): break
+
+            self.handle_accepted(socket_data[0], socket_data[1])
+            accepted_count += 1
         #
     #
 
@@ -177,7 +186,11 @@ on the channel's socket will succeed.
 
         if ((not self._listener_handle_connections) and self.is_active):
             try:
-                if (self._add_active_socket(self._listener_socket)): self._activate_connection(self._listener_socket)
+                datagram = self._receive_datagram()
+
+                if (datagram is not None and self._add_active_socket(self._listener_socket)):
+                    self._activate_datagram_connection(self._listener_socket, datagram[0], datagram[1])
+                #
             except ShutdownException as handled_exception:
                 exception = handled_exception.cause
 
@@ -315,6 +328,7 @@ Stops the listener and unqueues all running sockets.
             self._lock.release()
 
             self._remove_all_sockets()
+            self._worker_pool.stop()
 
             unix_socket_path_name = (self._listener_socket.getsockname()
                                      if (self._listener_socket.family == AF_UNIX) else
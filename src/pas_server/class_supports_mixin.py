@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.supports_mixin import SupportsMixin
+
+class ClassSupportsMixin(SupportsMixin):
+    """
+This mixin extends "SupportsMixin" with supported features defined once per
+class in "_supported_features_". The value is either a boolean or the name
+of a method called without arguments. Tables of all classes in the method
+resolution order are merged on first use. Features set in the instance
+"supported_features" dict take precedence.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _mixin_slots_ = SupportsMixin._mixin_slots_
+    """
+Additional __slots__ used for inherited classes.
+    """
+    _supported_features_ = { }
+    """
+Features supported by instances of this class
+    """
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        if (feature in self.supported_features):
+            _return = self.supported_features[feature]
+            if (type(_return) is not bool): _return = _return()
+        else:
+            _return = self.__class__._get_class_supported_features().get(feature, False)
+            if (type(_return) is not bool): _return = getattr(self, _return)()
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_class_supported_features(cls):
+        """
+Returns the merged supported features table of this class.
+
+:return: (dict) Supported features
+:since:  v1.1.0
+        """
+
+        _return = cls.__dict__.get("_supported_features_merged_")
+
+        if (_return is None):
+            _return = { }
+
+            for _class in reversed(cls.__mro__):
+                _return.update(_class.__dict__.get("_supported_features_", { }))
+            #
+
+            cls._supported_features_merged_ = _return
+        #
+
+        return _return
+    #
+#
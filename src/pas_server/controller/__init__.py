@@ -17,6 +17,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from .abstract_aio_connection import AbstractAioConnection
 from .abstract_connection import AbstractConnection
 from .abstract_dispatched_connection import AbstractDispatchedConnection
 from .abstract_inner_request import AbstractInnerRequest
@@ -25,7 +26,12 @@ from .abstract_response import AbstractResponse
 from .abstract_stream_response import AbstractStreamResponse
 from .abstract_thread_dispatched_connection import AbstractThreadDispatchedConnection
 from .aio_stream_response_mixin import AioStreamResponseMixin
+from .connection_settings import ConnectionSettings
 from .datagram_connection_mixin import DatagramConnectionMixin
+from .dispatched_stream_response import DispatchedStreamResponse
 from .dummy_connection import DummyConnection
+from .file_range_streamer import FileRangeStreamer
 from .msa_request_mixin import MsaRequestMixin
+from .pooled_mixin import PooledMixin
 from .stdout_stream_response import StdoutStreamResponse
+from .write_buffer_flusher import WriteBufferFlusher
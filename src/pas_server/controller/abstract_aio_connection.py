@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from asyncio import Protocol
+from inspect import isawaitable
+from time import time
+import asyncio
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
+
+from .abstract_connection import AbstractConnection
+from .abstract_request import AbstractRequest
+from .abstract_response import AbstractResponse
+
+class AbstractAioConnection(Protocol, AbstractConnection):
+    """
+This abstract class contains methods to implement a connection handled by
+coroutines on the "asyncio" event loop of the dispatcher. No thread is
+used while the connection is idle.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=unused-argument
+
+    __slots__ = [ "_client_socket_address",
+                  "_event_loop",
+                  "_read_buffer",
+                  "_read_buffer_max",
+                  "_read_eof",
+                  "_read_paused",
+                  "_read_timeout",
+                  "_read_waiter",
+                  "_server",
+                  "_transport",
+                  "_write_waiter"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(AbstractAioConnection)
+
+:since: v1.1.0
+        """
+
+        AbstractConnection.__init__(self)
+
+        self._client_socket_address = None
+        """
+Raw client socket address
+        """
+        self._event_loop = None
+        """
+"asyncio" event loop of the dispatcher
+        """
+        self._read_buffer = bytearray()
+        """
+Data buffer
+        """
+        self._read_buffer_max = int(Settings.get("pas_global_server_aio_read_buffer_max", 65536))
+        """
+Buffer size in bytes exceeding it will pause reading from the transport
+        """
+        self._read_eof = False
+        """
+True if the peer will not send any more data
+        """
+        self._read_paused = False
+        """
+True if reading from the transport is paused
+        """
+        self._read_timeout = int(Settings.get("global_server_socket_data_timeout", -1))
+        """
+Socket timeout value
+        """
+        self._read_waiter = None
+        """
+Future resolved if data has been received
+        """
+        self._server = None
+        """
+Server instance
+        """
+        self._transport = None
+        """
+"asyncio" transport instance
+        """
+        self._write_waiter = None
+        """
+Future resolved if the transport accepts data again
+        """
+
+        if (self._read_timeout < 1): self._read_timeout = int(Settings.get("global_socket_data_timeout", 30))
+    #
+
+    @property
+    def socket(self):
+        """
+Returns the underlying connection socket.
+
+:return: (object) Connection socket
+:since:  v1.1.0
+        """
+
+        return (None if (self._transport is None) else self._transport.get_extra_info("socket"))
+    #
+
+    def close(self):
+        """
+Closes the underlying transport. This method is thread-safe.
+
+:since: v1.1.0
+        """
+
+        if (self._transport is not None and self._event_loop is not None):
+            try: self._event_loop.call_soon_threadsafe(self._transport.close)
+            except RuntimeError: pass
+        #
+    #
+
+    def connection_lost(self, exc):
+        """
+python.org: Called when the connection is lost or closed.
+
+:param exc: Exception instance; None if closed as expected
+
+:since: v1.1.0
+        """
+
+        self._read_eof = True
+
+        self._wake_waiter(self._read_waiter)
+        self._wake_waiter(self._write_waiter)
+    #
+
+    def connection_made(self, transport):
+        """
+python.org: Called when a connection is made.
+
+:param transport: "asyncio" transport instance
+
+:since: v1.1.0
+        """
+
+        self._client_socket_address = transport.get_extra_info("peername")
+        self._transport = transport
+
+        if (self._server is None or (not self._server.handle_aio_connection(self))): transport.close()
+    #
+
+    def data_received(self, data):
+        """
+python.org: Called when some data is received.
+
+:param data: Data received
+
+:since: v1.1.0
+        """
+
+        self._read_buffer += data
+
+        if ((not self._read_paused) and len(self._read_buffer) > self._read_buffer_max):
+            self._read_paused = True
+            self._transport.pause_reading()
+        #
+
+        self._wake_waiter(self._read_waiter)
+    #
+
+    def eof_received(self):
+        """
+python.org: Called when the other end signals it won't send any more data.
+
+:return: (bool) True to keep the transport open for writing
+:since:  v1.1.0
+        """
+
+        self._read_eof = True
+        self._wake_waiter(self._read_waiter)
+
+        return True
+    #
+
+    def finish(self):
+        """
+Finish transmission and cleanup resources.
+
+:since: v1.1.0
+        """
+
+        if (self._server is not None):
+            if (not self._server.remove_activated_socket(self)): self.close()
+            self._server = None
+        #
+    #
+
+    async def get_data(self, size, force_size = False):
+        """
+Returns data received from the transport.
+
+:param size: Bytes to read
+:param force_size: True to wait for data until the given size has been
+                   received.
+
+:return: (bytes) Data received
+:since:  v1.1.0
+        """
+
+        data_size_required = (size if (force_size) else 1)
+        timeout_time = (time() + self._read_timeout)
+
+        while (len(self._read_buffer) < data_size_required and (not self._read_eof)):
+            timeout = (timeout_time - time())
+            if (timeout <= 0): break
+
+            self._read_waiter = self._event_loop.create_future()
+
+            try: await asyncio.wait_for(self._read_waiter, timeout)
+            except asyncio.TimeoutError: break
+            finally: self._read_waiter = None
+        #
+
+        data_size = min(size, len(self._read_buffer))
+
+        _return = bytes(self._read_buffer[:data_size])
+        del(self._read_buffer[:data_size])
+
+        if (self._read_paused and len(self._read_buffer) <= self._read_buffer_max and self._transport is not None):
+            self._read_paused = False
+            self._transport.resume_reading()
+        #
+
+        if (force_size and data_size < size): raise IOException("Received data size is smaller than the expected size of {0:d} bytes".format(size))
+        return _return
+    #
+
+    async def handle(self):
+        """
+Handles this connection. The request "execute()" method may return an
+awaitable that is awaited on the event loop.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        try:
+            request = self._new_request()
+            request.init(self)
+
+            response_scope_token = AbstractResponse.enter_request_scope()
+            scope_token = (request.enter_scope() if (isinstance(request, AbstractRequest)) else None)
+
+            try:
+                result = request.execute()
+                if (isawaitable(result)): await result
+            finally:
+                if (scope_token is not None): request.exit_scope(scope_token)
+                AbstractResponse.exit_request_scope(response_scope_token)
+
+                self._release_request(request)
+            #
+        except Exception as handled_exception: self.handle_execution_exception(handled_exception)
+        finally: self.finish()
+    #
+
+    def init_from_dispatcher(self, server):
+        """
+Initializes the connection based on relevant instance data from the
+underlying server.
+
+:param server: Server instance
+
+:since: v1.1.0
+        """
+
+        self._event_loop = server.event_loop
+        self._server = server
+    #
+
+    def pause_writing(self):
+        """
+python.org: Called when the transport's buffer goes over the high-water
+mark.
+
+:since: v1.1.0
+        """
+
+        if (self._write_waiter is None): self._write_waiter = self._event_loop.create_future()
+    #
+
+    def resume_writing(self):
+        """
+python.org: Called when the transport's buffer drains below the low-water
+mark.
+
+:since: v1.1.0
+        """
+
+        write_waiter = self._write_waiter
+        self._write_waiter = None
+
+        self._wake_waiter(write_waiter)
+    #
+
+    async def write_data(self, data):
+        """
+Write data to the transport and wait for it to accept more data if its
+buffer is full.
+
+:param data: Data to be written
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        _return = True
+
+        data = Binary.bytes(data)
+
+        if (self._transport is not None and len(data) > 0):
+            if (self._transport.is_closing()): _return = False
+            else:
+                self._transport.write(data)
+                if (self._write_waiter is not None): await self._write_waiter
+            #
+        #
+
+        return _return
+    #
+
+    async def write_data_vectored(self, buffers):
+        """
+Write the given list of data buffers to the transport without concatenating
+them first and wait for it to accept more data if its buffer is full.
+
+:param buffers: List of data to be written
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        _return = True
+
+        buffers = [ Binary.bytes(data) for data in buffers ]
+
+        if (self._transport is not None and len(buffers) > 0):
+            if (self._transport.is_closing()): _return = False
+            else:
+                self._transport.writelines(buffers)
+                if (self._write_waiter is not None): await self._write_waiter
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _wake_waiter(waiter):
+        """
+Resolves the given future if it is still pending.
+
+:param waiter: Future instance; None if not waiting
+
+:since: v1.1.0
+        """
+
+        if (waiter is not None and (not waiter.done())): waiter.set_result(None)
+    #
+#
@@ -19,10 +19,12 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 from dpt_logging import LogLine
 from dpt_module_loader import NamedClassLoader
-from dpt_runtime.stacked_dict import StackedDict
-from dpt_settings import Settings
 
+from .abstract_request import AbstractRequest
 from .abstract_request_mixin import AbstractRequestMixin
+from .abstract_response import AbstractResponse
+from .connection_settings import ConnectionSettings
+from .pooled_mixin import PooledMixin
 
 class AbstractConnection(AbstractRequestMixin):
     """
@@ -37,6 +39,13 @@ This abstract class contains common methods to implement a connection.
              Mozilla Public License, v. 2.0
     """
 
+    _supported_features_ = { "connection_parameters": True,
+                             "connection_settings": True,
+                             "stream_response_creation": False
+                           }
+    """
+Features supported by instances of this class
+    """
     __slots__ = [ "_stream_response" ] + AbstractRequestMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
@@ -58,10 +67,6 @@ Stream response instance
         """
 
         self._log_handler = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
-
-        self.supported_features['connection_parameters'] = True
-        self.supported_features['connection_settings'] = True
-        self.supported_features['stream_response_creation'] = False
     #
 
     def __del__(self):
@@ -84,10 +89,7 @@ Returns the parameters for the connection.
         """
 
         if ("_dpt_settings" not in self._parameters):
-            connection_settings = StackedDict()
-            connection_settings.add_dict(Settings.get_dict())
-
-            self.set_parameter("_dpt_settings", connection_settings)
+            self.set_parameter("_dpt_settings", ConnectionSettings())
         #
 
         return self._parameters
@@ -128,7 +130,17 @@ Handles this connection.
             request = self._new_request()
 
             request.init(self)
-            request.execute()
+
+            response_scope_token = AbstractResponse.enter_request_scope()
+            scope_token = (request.enter_scope() if (isinstance(request, AbstractRequest)) else None)
+
+            try: request.execute()
+            finally:
+                if (scope_token is not None): request.exit_scope(scope_token)
+                AbstractResponse.exit_request_scope(response_scope_token)
+
+                self._release_request(request)
+            #
         except Exception as handled_exception: self.handle_execution_exception(handled_exception)
     #
 
@@ -177,4 +189,21 @@ additional arguments are required.
 
         raise NotImplementedException()
     #
+
+    def _release_request(self, request):
+        """
+Releases the given request and the response bound to it if they are pooled.
+It is called after the request has been handled and its scope has been
+left.
+
+:param request: Request object
+
+:since: v1.1.0
+        """
+
+        response = (request.bound_response if (isinstance(request, AbstractRequest)) else None)
+
+        if (isinstance(response, PooledMixin)): response.release()
+        if (isinstance(request, PooledMixin)): request.release()
+    #
 #
@@ -17,17 +17,25 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from socket import socket, SHUT_RDWR, SOCK_STREAM
+from socket import socket, AF_INET, AF_INET6, IPPROTO_TCP, SHUT_RDWR, SOCK_STREAM
+from threading import RLock
 from time import time
+import os
+import socket as socket_module
 
 from dpt_module_loader import NamedClassLoader
 from dpt_plugins import Hook
 from dpt_runtime.binary import Binary
 from dpt_runtime.descriptor_selector import DescriptorSelector
 from dpt_runtime.io_exception import IOException
+from dpt_runtime.operation_not_supported_exception import OperationNotSupportedException
 from dpt_settings import Settings
+from dpt_threading.thread import Thread
 
 from .abstract_connection import AbstractConnection
+from .connection_settings import ConnectionSettings
+from .dispatched_stream_response import DispatchedStreamResponse
+from .write_buffer_flusher import WriteBufferFlusher
 
 class AbstractDispatchedConnection(AbstractConnection):
     """
@@ -45,7 +53,44 @@ handler.
 
     # pylint: disable=unused-argument
 
-    __slots__ = [ "_client_socket_address", "_read_buffer", "_read_timeout", "_server", "_socket", "_socket_family" ]
+    IOV_MAX = 1024
+    """
+Maximum number of buffers given to a single "sendmsg()" call
+    """
+
+    _supported_features_ = { "stream_response_creation": "_supports_stream_response_creation" }
+    """
+Features supported by instances of this class
+    """
+
+    __slots__ = [ "_client_socket_address",
+                  "_datagram_complete",
+                  "_frame_size_max",
+                  "_keep_alive",
+                  "_keep_alive_requests_max",
+                  "_keep_alive_timeout",
+                  "_poller",
+                  "_read_buffer",
+                  "_read_buffer_end",
+                  "_read_buffer_start",
+                  "_read_timeout",
+                  "_request_data_rate_grace",
+                  "_request_data_rate_min",
+                  "_request_data_size",
+                  "_request_time_started",
+                  "_request_timeout",
+                  "_server",
+                  "_socket",
+                  "_socket_family",
+                  "stream_response_creation",
+                  "_write_buffer",
+                  "_write_buffer_max",
+                  "_write_buffer_time",
+                  "_write_buffer_timeout",
+                  "_write_cork",
+                  "_write_corked",
+                  "_write_lock"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -64,13 +109,67 @@ Constructor __init__(AbstractDispatchedConnection)
         """
 Raw client socket address
         """
-        self._read_buffer = Binary.BYTES_TYPE()
+        self._datagram_complete = False
+        """
+True if the connection has been initialized with a complete datagram not to
+read further data from the shared listener socket
+        """
+        self._frame_size_max = None
+        """
+Default maximum frame size in bytes
+        """
+        self._keep_alive = False
+        """
+True to handle successive requests received on the same stream socket
+        """
+        self._keep_alive_requests_max = None
+        """
+Maximum number of requests handled on the same socket
+        """
+        self._keep_alive_timeout = None
         """
-Data buffer
+Time in seconds to wait for the next request on an idle socket
         """
-        self._read_timeout = int(Settings.get("global_server_socket_data_timeout", -1))
+        self._poller = None
+        """
+Descriptor selector reused to wait for the socket
+        """
+        self._read_buffer = bytearray()
+        """
+Data buffer received into
+        """
+        self._read_buffer_end = 0
+        """
+Offset of the end of data received in the buffer
+        """
+        self._read_buffer_start = 0
+        """
+Offset of the first byte not yet returned from the buffer
+        """
+        self._read_timeout = None
         """
 Socket timeout value
+        """
+        self._request_data_rate_grace = None
+        """
+Time in seconds before the minimum data rate is enforced
+        """
+        self._request_data_rate_min = None
+        """
+Minimum data rate in bytes per second to receive request data with; 0 to
+disable
+        """
+        self._request_data_size = 0
+        """
+Data size in bytes received for the current request
+        """
+        self._request_time_started = None
+        """
+UNIX timestamp the current request has been started
+        """
+        self._request_timeout = None
+        """
+Time in seconds available to receive data for a request; 0 to disable
         """
         self._server = None
         """
@@ -84,8 +183,69 @@ Socket instance
         """
 Socket connection family
         """
+        self.stream_response_creation = False
+        """
+True to create stream responses writing to stream sockets of this connection
+for new requests
+        """
+        self._write_buffer = bytearray()
+        """
+Data buffered to be written together
+        """
+        self._write_buffer_max = 0
+        """
+Buffered data size in bytes exceeding it will flush the write buffer; 0 to
+disable write coalescing
+        """
+        self._write_buffer_time = 0
+        """
+UNIX timestamp of the oldest data in the write buffer
+        """
+        self._write_buffer_timeout = None
+        """
+Time in seconds after which buffered data is flushed
+        """
+        self._write_cork = False
+        """
+True to set "TCP_CORK" while data is coalesced
+        """
+        self._write_corked = False
+        """
+True if "TCP_CORK" is set for the socket
+        """
+        self._write_lock = RLock()
+        """
+Lock used to serialize writes of coalesced data
+        """
+    #
+
+    @property
+    def keep_alive(self):
+        """
+Returns true if the socket is kept open for the next request after the
+current one has been handled.
+
+:return: (bool) True if kept alive
+:since:  v1.1.0
+        """
+
+        return self._keep_alive
+    #
+
+    @keep_alive.setter
+    def keep_alive(self, keep_alive):
+        """
+Sets if the socket is kept open for the next request. Requests may disable
+it to close the connection after being handled. It is only supported for
+connections executed in a separate thread as waiting for the next request
+blocks the caller otherwise.
+
+:param keep_alive: True to keep the socket open
 
-        if (self._read_timeout < 1): self._read_timeout = int(Settings.get("global_socket_data_timeout", 30))
+:since: v1.1.0
+        """
+
+        self._keep_alive = (keep_alive and isinstance(self, Thread))
     #
 
     @property
@@ -108,6 +268,8 @@ Finish transmission and cleanup resources.
         """
 
         if (self._server is not None):
+            if (self._socket is not None): self.flush()
+
             if (isinstance(self._socket, socket) and (self._socket.type & SOCK_STREAM) and SHUT_RDWR is not None):
                 try: self._socket.shutdown(SHUT_RDWR)
                 except Exception: pass
@@ -115,70 +277,315 @@ Finish transmission and cleanup resources.
 
             self._server.remove_activated_socket(self._socket)
 
+            self._poller = None
             self._server = None
             self._socket = None
         #
     #
 
-    def get_data(self, size, force_size = False):
+    def _cork(self):
         """
-Returns data read from the socket.
+Sets "TCP_CORK" for the socket if configured to hold back partial frames
+until the write buffer is flushed.
+
+:since: v1.1.0
+        """
+
+        if (self._write_cork and (not self._write_corked)):
+            try:
+                self._socket.setsockopt(IPPROTO_TCP, socket_module.TCP_CORK, 1)
+                self._write_corked = True
+            except OSError: self._write_cork = False
+        #
+    #
+
+    def _consume_read_buffer(self, size):
+        """
+Returns a view of the given number of buffered bytes and marks them as
+returned. The view is only valid until data is received again.
+
+:param size: Bytes to return
+
+:return: (object) memoryview of the data
+:since:  v1.1.0
+        """
+
+        start = self._read_buffer_start
+        self._read_buffer_start += size
+
+        _return = memoryview(self._read_buffer)[start:self._read_buffer_start]
+
+        if (self._read_buffer_start >= self._read_buffer_end):
+            self._read_buffer_end = 0
+            self._read_buffer_start = 0
+        #
+
+        return _return
+    #
+
+    def _fill_read_buffer(self, size, force_size):
+        """
+Receives data into the internal receive buffer until data is available or,
+if forced, the given size has been buffered.
 
 :param size: Bytes to read
 :param force_size: True to wait for data until the given size has been
                    received.
 
-:return: (bytes) Data received
-:since:  v1.0.0
+:return: (int) Bytes available in the receive buffer
+:since:  v1.1.0
         """
 
         # pylint: disable=broad-except
 
-        _return = Binary.BYTES_TYPE()
+        if (len(self._write_buffer) > 0 or self._write_corked): self.flush()
 
-        data = None
-        data_size = len(self._read_buffer)
-        selector = DescriptorSelector([ self._socket.fileno() ])
-        _time = time()
-        timeout_time = (_time + self._read_timeout)
+        _return = (self._read_buffer_end - self._read_buffer_start)
+        timeout_time = (time() + self._read_timeout)
 
-        while (self._socket is not None
+        while ((not self._datagram_complete)
+               and self._socket is not None
                and self._socket.fileno() > -1
-               and (data is None or (force_size and data_size < size))
-               and _time < timeout_time
+               and (_return < 1 or (force_size and _return < size))
               ):
-            try:
-                selector.select(timeout_time - _time, False)
+            try: data_received_size = self._receive(size - _return)
+            except BlockingIOError:
+                if (not self._wait_for_request_data(timeout_time)): break
+                continue
+            except Exception: break
+
+            if (data_received_size > 0): _return += data_received_size
+            elif (self._socket.type & SOCK_STREAM): break
+        #
 
-                if (self._socket_family is None):
-                    ( data, address ) = self._socket.recvfrom(size)
-                    address_family = self._socket.family
+        return _return
+    #
 
-                    self._set_socket_address(address_family, address)
-                else: data = self._socket.recv(size)
+    def flush(self):
+        """
+Writes all data buffered for write coalescing and releases "TCP_CORK" if
+set.
 
-                _time = time()
-            except Exception: break
+:return: (bool) True on success
+:since:  v1.1.0
+        """
 
-            if (len(data) > 0):
-                self._set_data(data)
-                data_size = len(self._read_buffer)
-            else: data = None
+        # pylint: disable=broad-except
+
+        _return = True
+
+        with self._write_lock:
+            if (self._socket is not None and (len(self._write_buffer) > 0 or self._write_corked)):
+                try:
+                    self._flush_write_buffer()
+                    self._uncork()
+                except Exception as handled_exception:
+                    if (self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                    _return = False
+                #
+            #
         #
 
-        if (len(self._read_buffer) > 0):
-            _return = self._read_buffer
-            self._read_buffer = Binary.BYTES_TYPE()
+        return _return
+    #
+
+    def flush_expired_write_buffer(self):
+        """
+Writes data buffered for write coalescing if the write buffer timeout has
+passed. Data is only written as far as the socket accepts it without
+blocking; the remaining data is scheduled again.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._write_lock.acquire(False)):
+            try:
+                if (self._socket is not None
+                    and len(self._write_buffer) > 0
+                    and time() >= self._write_buffer_time + self._write_buffer_timeout
+                   ):
+                    try:
+                        sent_size = self._socket.send(self._write_buffer)
+                        del(self._write_buffer[:sent_size])
+                    except BlockingIOError: pass
+
+                    if (len(self._write_buffer) > 0):
+                        self._write_buffer_time = time()
+                        WriteBufferFlusher.schedule(self, self._write_buffer_time + self._write_buffer_timeout)
+                    else: self._uncork()
+                #
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+            finally: self._write_lock.release()
+        elif (self._socket is not None and len(self._write_buffer) > 0): WriteBufferFlusher.schedule(self, time() + self._write_buffer_timeout)
+    #
+
+    def _flush_write_buffer(self):
+        """
+Writes all data buffered for write coalescing.
+
+:since: v1.1.0
+        """
+
+        if (len(self._write_buffer) > 0):
+            data = self._write_buffer
+            self._write_buffer = bytearray()
+
+            self._write(data)
         #
+    #
+
+    def get_data(self, size, force_size = False):
+        """
+Returns data read from the socket.
+
+:param size: Bytes to read
+:param force_size: True to wait for data until the given size has been
+                   received.
+
+:return: (bytes) Data received
+:since:  v1.0.0
+        """
+
+        return self.get_data_view(size, force_size).tobytes()
+    #
+
+    def get_data_view(self, size, force_size = False):
+        """
+Returns data read from the socket as a view of the internal receive buffer
+without copying it. The view is only valid until data is read again.
+
+:param size: Bytes to read
+:param force_size: True to wait for data until the given size has been
+                   received.
+
+:return: (object) memoryview of the data received
+:since:  v1.1.0
+        """
+
+        data_size = self._fill_read_buffer(size, force_size)
 
         if (force_size and data_size < size): raise IOException("Received data size is smaller than the expected size of {0:d} bytes".format(size))
+        return self._consume_read_buffer(min(size, data_size))
+    #
+
+    def get_frame(self, length_size = 4, max_size = None):
+        """
+Returns the next frame read from the socket. A frame consists of its size
+encoded as a big-endian unsigned integer followed by the frame data. The
+view returned is only valid until data is read again.
+
+:param length_size: Size in bytes of the length prefix
+:param max_size: Maximum frame size in bytes; None for the configured
+                 default
+
+:return: (object) memoryview of the frame data; None if the connection has
+         been closed or timed out before a new frame has been received
+:since:  v1.1.0
+        """
+
+        if (max_size is None): max_size = self._frame_size_max
+
+        _return = None
+        data_size = self._fill_read_buffer(length_size, True)
+
+        if (data_size > 0):
+            if (data_size < length_size): raise IOException("Received data size is smaller than the expected size of {0:d} bytes".format(length_size))
+
+            frame_size = int.from_bytes(self._read_buffer[self._read_buffer_start:self._read_buffer_start + length_size], "big")
+            if (frame_size > max_size): raise IOException("Received frame size of {0:d} bytes exceeds the maximum size of {1:d} bytes".format(frame_size, max_size))
+
+            self._consume_read_buffer(length_size)
+            _return = (self.get_data_view(frame_size, True) if (frame_size > 0) else memoryview(b""))
+        #
+
         return _return
     #
 
+    def get_frames(self, length_size = 4, max_size = None):
+        """
+Returns a generator yielding frames read from the socket until the
+connection has been closed or timed out. Each view yielded is only valid
+until the next frame is requested.
+
+:param length_size: Size in bytes of the length prefix
+:param max_size: Maximum frame size in bytes; None for the configured
+                 default
+
+:return: (object) Generator yielding memoryviews of the frame data
+:since:  v1.1.0
+        """
+
+        frame = self.get_frame(length_size, max_size)
+
+        while (frame is not None):
+            yield frame
+            frame = self.get_frame(length_size, max_size)
+        #
+    #
+
+    def _get_request_deadline(self):
+        """
+Returns the UNIX timestamp request data needs to be received until based on
+the request timeout and minimum data rate configured.
+
+:return: (float) UNIX timestamp; None if not limited
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        if (self._request_time_started is not None):
+            if (self._request_timeout > 0): _return = (self._request_time_started + self._request_timeout)
+
+            if (self._request_data_rate_min > 0):
+                rate_deadline = (self._request_time_started
+                                 + self._request_data_rate_grace
+                                 + (self._request_data_size / self._request_data_rate_min)
+                                )
+
+                if (_return is None or rate_deadline < _return): _return = rate_deadline
+            #
+        #
+
+        return _return
+    #
+
+    def handle(self):
+        """
+Handles this connection. Successive requests are handled on stream sockets
+if keep-alive is enabled until the socket is idle for longer than the
+keep-alive timeout or the maximum number of requests has been reached.
+
+:since: v1.1.0
+        """
+
+        requests_count = 0
+
+        while (True):
+            self._request_data_size = 0
+            self._request_time_started = time()
+
+            AbstractConnection.handle(self)
+            requests_count += 1
+
+            if ((not self._keep_alive)
+                or requests_count >= self._keep_alive_requests_max
+                or self._server is None
+                or (not self._server.is_active)
+                or (not isinstance(self._socket, socket))
+                or (not self._socket.type & SOCK_STREAM)
+                or (not self._wait_for_next_request())
+               ): break
+        #
+    #
+
     def init_from_dispatcher(self, server, _socket):
         """
 Initializes the connection based on relevant instance data from the underlying
-server and socket.
+server and socket. Settings are taken from the ones read once by the server.
 
 :param server: Server instance
 :param _socket: Active socket resource
@@ -186,13 +593,196 @@ server and socket.
 :since: v1.0.0
         """
 
+        connection_settings = getattr(server, "connection_settings", None)
+        if (connection_settings is None): connection_settings = self.__class__.load_settings()
+
+        self._frame_size_max = connection_settings['frame_size_max']
+        self._keep_alive = (connection_settings['keep_alive'] and isinstance(self, Thread))
+        self._keep_alive_requests_max = connection_settings['keep_alive_requests_max']
+        self._keep_alive_timeout = connection_settings['keep_alive_timeout']
+        self._read_timeout = connection_settings['read_timeout']
+        self._request_data_rate_grace = connection_settings['request_data_rate_grace']
+        self._request_data_rate_min = connection_settings['request_data_rate_min']
+        self._request_timeout = connection_settings['request_timeout']
         self._server = server
         self._socket = _socket
+        self._write_buffer_max = connection_settings['write_buffer_max']
+        self._write_buffer_timeout = connection_settings['write_buffer_timeout']
+        self._write_cork = connection_settings['write_cork']
 
-        if (isinstance(self._socket, socket)
-            and (self._socket.type & SOCK_STREAM)
-            and self._read_timeout is not None
-           ): self._socket.settimeout(self._read_timeout)
+        if (isinstance(self._socket, socket) and (self._socket.type & SOCK_STREAM)):
+            self._socket.setblocking(False)
+            if (self._socket.family not in ( AF_INET, AF_INET6 )): self._write_cork = False
+        else: self._write_buffer_max = 0
+    #
+
+    def init_from_dispatcher_datagram(self, server, _socket, data, address):
+        """
+Initializes the connection for a datagram already received by the
+underlying server. The datagram is handled as the complete data of the
+connection and no further data is read from the shared listener socket.
+
+:param server: Server instance
+:param _socket: Active socket resource
+:param data: Datagram data received
+:param address: Raw client socket address
+
+:since: v1.1.0
+        """
+
+        self.init_from_dispatcher(server, _socket)
+
+        self._datagram_complete = True
+        self._set_socket_address(_socket.family, address)
+        self._set_data(data)
+    #
+
+    def new_stream_response(self):
+        """
+Initializes a new stream response instance writing to the stream socket of
+this connection.
+
+:return: (object) Stream response object
+:since:  v1.1.0
+        """
+
+        if (not (isinstance(self._socket, socket) and (self._socket.type & SOCK_STREAM))):
+            raise OperationNotSupportedException("'{0!r}' is not connected to a stream socket".format(self))
+        #
+
+        return DispatchedStreamResponse(self)
+    #
+
+    def read_until(self, delimiter, max_size = 65536):
+        """
+Returns data read from the socket up to and including the given delimiter.
+Data received after the delimiter is kept for the next read. Only new data
+is scanned for the delimiter while waiting for it.
+
+:param delimiter: Delimiter to read until
+:param max_size: Maximum size in bytes of the data including the delimiter
+
+:return: (bytes) Data received; data received before the connection has
+         been closed may not end with the delimiter
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (len(self._write_buffer) > 0 or self._write_corked): self.flush()
+
+        delimiter = Binary.bytes(delimiter)
+        delimiter_size = len(delimiter)
+
+        _return = None
+        data_scanned_size = 0
+        timeout_time = (time() + self._read_timeout)
+
+        while (_return is None):
+            position = self._read_buffer.find(delimiter, self._read_buffer_start + data_scanned_size, self._read_buffer_end)
+
+            if (position > -1):
+                size = (position + delimiter_size - self._read_buffer_start)
+                if (size > max_size): raise IOException("Received data exceeds the maximum size of {0:d} bytes before the delimiter".format(max_size))
+
+                _return = self._consume_read_buffer(size).tobytes()
+                break
+            #
+
+            data_size = (self._read_buffer_end - self._read_buffer_start)
+            if (data_size >= max_size): raise IOException("Received data exceeds the maximum size of {0:d} bytes before the delimiter".format(max_size))
+
+            data_scanned_size = max(0, data_size + 1 - delimiter_size)
+
+            if (self._datagram_complete or self._socket is None or self._socket.fileno() < 0): data_received_size = 0
+            else:
+                try: data_received_size = self._receive(min(max_size - data_size, 65536))
+                except BlockingIOError:
+                    if (not self._wait_for_request_data(timeout_time)): raise IOException("Timeout occurred while waiting for the delimiter")
+                    continue
+                #
+            #
+
+            if (data_received_size < 1
+                and (self._datagram_complete or self._socket is None or (self._socket.type & SOCK_STREAM))
+               ):
+                _return = self._consume_read_buffer(data_size).tobytes()
+            #
+        #
+
+        return _return
+    #
+
+    def readline(self, max_size = 65536):
+        """
+Returns a line read from the socket including the line feed.
+
+:param max_size: Maximum size in bytes of the line
+
+:return: (bytes) Line received; empty if the connection has been closed
+:since:  v1.1.0
+        """
+
+        return self.read_until(b"\n", max_size)
+    #
+
+    def _receive(self, size):
+        """
+Receives up to the given number of bytes from the socket directly into the
+internal receive buffer.
+
+:param size: Bytes to receive at most
+
+:return: (int) Bytes received
+:since:  v1.1.0
+        """
+
+        self._reserve_read_buffer(size)
+
+        with memoryview(self._read_buffer) as view:
+            buffer_view = view[self._read_buffer_end:self._read_buffer_end + size]
+
+            if (self._socket_family is None):
+                ( _return, address ) = self._socket.recvfrom_into(buffer_view, size)
+                self._set_socket_address(self._socket.family, address)
+            else: _return = self._socket.recv_into(buffer_view, size)
+
+            buffer_view.release()
+        #
+
+        self._read_buffer_end += _return
+        self._request_data_size += _return
+
+        return _return
+    #
+
+    def _reserve_read_buffer(self, size):
+        """
+Makes sure that the given number of bytes can be appended to the internal
+receive buffer. A new buffer is allocated instead of resizing the existing
+one to keep views returned previously intact.
+
+:param size: Bytes to be appended
+
+:since: v1.1.0
+        """
+
+        buffer_size = len(self._read_buffer)
+
+        if (buffer_size - self._read_buffer_end < size):
+            data_size = (self._read_buffer_end - self._read_buffer_start)
+            new_buffer_size = max(buffer_size, 4096)
+
+            while (new_buffer_size < data_size + size): new_buffer_size *= 2
+
+            read_buffer = bytearray(new_buffer_size)
+
+            if (data_size > 0): read_buffer[:data_size] = self._read_buffer[self._read_buffer_start:self._read_buffer_end]
+
+            self._read_buffer = read_buffer
+            self._read_buffer_end = data_size
+            self._read_buffer_start = 0
+        #
     #
 
     def _set_data(self, data):
@@ -204,7 +794,13 @@ Sets data returned next time "get_data()" is called.
 :since: v1.0.0
         """
 
-        self._read_buffer += Binary.bytes(data)
+        data = Binary.bytes(data)
+        data_size = len(data)
+
+        self._reserve_read_buffer(data_size)
+
+        self._read_buffer[self._read_buffer_end:self._read_buffer_end + data_size] = data
+        self._read_buffer_end += data_size
     #
 
     def _set_socket_address(self, family, address):
@@ -221,6 +817,247 @@ Sets the socket family and address for this connection.
         self._socket_family = family
     #
 
+    def _supports_stream_response_creation(self):
+        """
+Returns true if stream responses are created for new requests. It has to be
+enabled with "stream_response_creation" and is only supported for stream
+sockets.
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        return (self.stream_response_creation
+                and isinstance(self._socket, socket)
+                and (self._socket.type & SOCK_STREAM) == SOCK_STREAM
+               )
+    #
+
+    def _uncork(self):
+        """
+Releases "TCP_CORK" if set for the socket.
+
+:since: v1.1.0
+        """
+
+        if (self._write_corked):
+            self._write_corked = False
+            self._socket.setsockopt(IPPROTO_TCP, socket_module.TCP_CORK, 0)
+        #
+    #
+
+    def _wait_for_next_request(self):
+        """
+Waits up to the keep-alive timeout for data of the next request.
+
+:return: (bool) True if data has been received
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (len(self._write_buffer) > 0 or self._write_corked): self.flush()
+
+        data_size = (self._read_buffer_end - self._read_buffer_start)
+        timeout_time = (time() + self._keep_alive_timeout)
+
+        while (data_size < 1 and self._socket is not None and self._socket.fileno() > -1):
+            try: data_received_size = self._receive(4096)
+            except BlockingIOError:
+                if (not self._wait_for_socket(timeout_time)): break
+                continue
+            except Exception: break
+
+            if (data_received_size < 1): break
+            data_size += data_received_size
+        #
+
+        return (data_size > 0)
+    #
+
+    def _wait_for_request_data(self, timeout_time):
+        """
+Waits for the socket to become readable until the given timeout or the
+request deadline. The connection is not kept alive if request data has not
+been received before the deadline.
+
+:param timeout_time: UNIX timestamp to wait until at most
+
+:return: (bool) False if timed out
+:since:  v1.1.0
+        """
+
+        deadline = self._get_request_deadline()
+
+        if (deadline is None or timeout_time <= deadline): _return = self._wait_for_socket(timeout_time)
+        else:
+            _return = self._wait_for_socket(deadline)
+
+            if ((not _return) and time() >= self._get_request_deadline()):
+                self._keep_alive = False
+                raise IOException("Request data has not been received within the time available")
+            #
+        #
+
+        return _return
+    #
+
+    def _wait_for_socket(self, timeout_time, is_writable = False):
+        """
+Waits for the socket to become readable or writable using the poller of
+this connection.
+
+:param timeout_time: UNIX timestamp to wait until at most
+:param is_writable: True to wait for the socket to become writable instead
+                    of readable
+
+:return: (bool) False if timed out
+:since:  v1.1.0
+        """
+
+        _time = time()
+
+        if (self._poller is None):
+            descriptor = self._socket.fileno()
+            self._poller = DescriptorSelector([ descriptor ], [ descriptor ])
+        #
+
+        if (_time < timeout_time):
+            descriptors = self._poller.select(timeout_time - _time, False, (not is_writable), is_writable)
+            _return = (len(descriptors[1 if (is_writable) else 0]) > 0 or time() < timeout_time)
+        else: _return = False
+
+        return _return
+    #
+
+    def _write(self, data):
+        """
+Writes all of the given data to the socket. The poller of this connection
+is used to wait for a non-blocking socket to become writable again.
+
+:param data: Bytes-like object to be written
+
+:since: v1.1.0
+        """
+
+        data_view = memoryview(data)
+
+        while (len(data_view) > 0):
+            try: data_view = data_view[self._socket.send(data_view):]
+            except BlockingIOError:
+                if (not self._wait_for_socket(time() + self._read_timeout, True)): raise IOException("Timeout occurred while writing data to the socket")
+            #
+        #
+    #
+
+    def _write_coalesced(self, data):
+        """
+Adds the given data to the write buffer. The buffer is flushed if it
+exceeds the configured size or if the oldest data buffered exceeds the
+configured time. Data left in the buffer is flushed by the
+"WriteBufferFlusher" once the configured time has passed.
+
+:param data: Bytes-like object to be written
+
+:since: v1.1.0
+        """
+
+        _time = time()
+
+        with self._write_lock:
+            is_buffer_empty = (len(self._write_buffer) < 1)
+
+            if (is_buffer_empty):
+                self._cork()
+                self._write_buffer_time = _time
+            #
+
+            self._write_buffer += data
+
+            if (len(self._write_buffer) >= self._write_buffer_max
+                or _time - self._write_buffer_time >= self._write_buffer_timeout
+               ): self._flush_write_buffer()
+            elif (is_buffer_empty): WriteBufferFlusher.schedule(self, _time + self._write_buffer_timeout)
+        #
+    #
+
+    def _write_file(self, file_descriptor, offset, count):
+        """
+Writes the given range of the file descriptor to the socket. "os.sendfile()"
+is used for stream sockets to avoid copying the data through Python memory.
+
+:param file_descriptor: File descriptor to read from
+:param offset: Offset to start reading from
+:param count: Number of bytes to write
+
+:since: v1.1.0
+        """
+
+        if (hasattr(os, "sendfile") and (self._socket.type & SOCK_STREAM)):
+            while (count > 0):
+                try: sent_size = os.sendfile(self._socket.fileno(), file_descriptor, offset, count)
+                except BlockingIOError:
+                    if (not self._wait_for_socket(time() + self._read_timeout, True)): raise IOException("Timeout occurred while writing data to the socket")
+                    continue
+                #
+
+                if (sent_size < 1): raise IOException("File ended before the expected size of {0:d} bytes has been sent".format(count))
+
+                count -= sent_size
+                offset += sent_size
+            #
+        else:
+            os.lseek(file_descriptor, offset, os.SEEK_SET)
+
+            while (count > 0):
+                data = os.read(file_descriptor, min(count, 65536))
+                if (len(data) < 1): raise IOException("File ended before the expected size of {0:d} bytes has been sent".format(count))
+
+                self._write(data)
+                count -= len(data)
+            #
+        #
+    #
+
+    def _write_vectored(self, buffers):
+        """
+Writes all of the given buffers to the socket with as few "sendmsg()" calls
+as possible. Partially sent buffers are continued with the remaining data.
+
+:param buffers: List of bytes-like objects to be written
+
+:since: v1.1.0
+        """
+
+        if (not hasattr(self._socket, "sendmsg")):
+            for data in buffers: self._write(data)
+        else:
+            data_views = [ memoryview(data).cast("B") for data in buffers if len(data) > 0 ]
+            data_views_count = len(data_views)
+            index = 0
+
+            while (index < data_views_count):
+                try: sent_size = self._socket.sendmsg(data_views[index:index + AbstractDispatchedConnection.IOV_MAX])
+                except BlockingIOError:
+                    if (not self._wait_for_socket(time() + self._read_timeout, True)): raise IOException("Timeout occurred while writing data to the socket")
+                    continue
+                #
+
+                while (sent_size > 0):
+                    data_view_size = len(data_views[index])
+
+                    if (sent_size < data_view_size):
+                        data_views[index] = data_views[index][sent_size:]
+                        sent_size = 0
+                    else:
+                        index += 1
+                        sent_size -= data_view_size
+                    #
+                #
+            #
+        #
+    #
+
     def write_data(self, data):
         """
 Write data to the socket.
@@ -238,7 +1075,9 @@ Write data to the socket.
         data = Binary.bytes(data)
 
         if (self._socket is not None and len(data) > 0):
-            try: self._socket.sendall(data)
+            try:
+                if (self._write_buffer_max < 1): self._write(data)
+                else: self._write_coalesced(data)
             except Exception as handled_exception:
                 if (self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
                 _return = False
@@ -247,4 +1086,124 @@ Write data to the socket.
 
         return _return
     #
+
+    def write_data_vectored(self, buffers):
+        """
+Write the given list of data buffers to the socket. Buffers are sent
+together without concatenating them first.
+
+:param buffers: List of data to be written
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = True
+
+        buffers = [ Binary.bytes(data) for data in buffers ]
+
+        if (self._socket is not None and len(buffers) > 0):
+            try:
+                with self._write_lock:
+                    if (self._write_buffer_max > 0):
+                        self._cork()
+                        self._flush_write_buffer()
+                    #
+
+                    self._write_vectored(buffers)
+                #
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                _return = False
+            #
+        #
+
+        return _return
+    #
+
+    def write_file(self, file_descriptor, offset, count):
+        """
+Write the given range of the file descriptor to the socket.
+
+:param file_descriptor: File descriptor to read from
+:param offset: Offset to start reading from
+:param count: Number of bytes to write
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = True
+
+        if (self._socket is not None and count > 0):
+            try:
+                with self._write_lock:
+                    if (self._write_buffer_max > 0):
+                        self._cork()
+                        self._flush_write_buffer()
+                    #
+
+                    self._write_file(file_descriptor, offset, count)
+                #
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                _return = False
+            #
+        #
+
+        return _return
+    #
+
+    def write_frame(self, data, length_size = 4):
+        """
+Write the given data as a frame prefixed by its size encoded as a
+big-endian unsigned integer.
+
+:param data: Frame data to be written
+:param length_size: Size in bytes of the length prefix
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        data = Binary.bytes(data)
+        data_size = len(data)
+
+        if (data_size >= 1 << (8 * length_size)): raise IOException("Frame size of {0:d} bytes exceeds the length prefix size".format(data_size))
+
+        return self.write_data_vectored([ data_size.to_bytes(length_size, "big"), data ])
+    #
+
+    @staticmethod
+    def load_settings():
+        """
+Reads the settings applied to dispatched connections. Dispatchers read them
+once to initialize all connections activated.
+
+:return: (dict) Connection settings
+:since:  v1.1.0
+        """
+
+        read_timeout = int(Settings.get("global_server_socket_data_timeout", -1))
+        if (read_timeout < 1): read_timeout = int(Settings.get("global_socket_data_timeout", 30))
+
+        return { "frame_size_max": int(Settings.get("pas_global_server_frame_size_max", 16777216)),
+                 "keep_alive": ConnectionSettings.is_setting_enabled("pas_global_server_keep_alive"),
+                 "keep_alive_requests_max": int(Settings.get("pas_global_server_keep_alive_requests_max", 100)),
+                 "keep_alive_timeout": float(Settings.get("pas_global_server_keep_alive_timeout", 5)),
+                 "read_timeout": read_timeout,
+                 "request_data_rate_grace": float(Settings.get("pas_global_server_request_data_rate_grace", 10)),
+                 "request_data_rate_min": int(Settings.get("pas_global_server_request_data_rate_min", 0)),
+                 "request_timeout": float(Settings.get("pas_global_server_request_timeout", 0)),
+                 "write_buffer_max": int(Settings.get("pas_global_server_write_buffer_size", 0)),
+                 "write_buffer_timeout": float(Settings.get("pas_global_server_write_buffer_timeout", 0.2)),
+                 "write_cork": (ConnectionSettings.is_setting_enabled("pas_global_server_write_tcp_cork")
+                                and hasattr(socket_module, "TCP_CORK")
+                               )
+               }
+    #
 #
@@ -17,6 +17,8 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from collections import ChainMap
+
 from dpt_runtime.not_implemented_exception import NotImplementedException
 
 from .abstract_request_mixin import AbstractRequestMixin
@@ -24,7 +26,10 @@ from .abstract_request_mixin import AbstractRequestMixin
 class AbstractInnerRequest(AbstractRequestMixin):
     """
 This abstract class contains common methods for inner requests usually used
-for redirection.
+for redirection. Parameters are layered: an inner request only holds its
+own values and looks up all others in the request it has been initialized
+from. Chained parameters of an inner request it has been initialized from
+are only layered the same way if "_parameters_chained_inherited_" is true.
 
 :author:     direct Netware Group et al.
 :copyright:  (C) direct Netware Group - All rights reserved
@@ -35,11 +40,22 @@ for redirection.
              Mozilla Public License, v. 2.0
     """
 
+    _supported_features_ = { "listener_data": "_supports_listener_data",
+                             "parameters_chained": True
+                           }
+    """
+Features supported by instances of this class
+    """
     __slots__ = [ "__weakref__", "_parameters_chained" ] + AbstractRequestMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _parameters_chained_inherited_ = False
+    """
+True to look up chained parameters not set in the chained parameters of the
+request initialized from
+    """
 
     def __init__(self):
         """
@@ -50,13 +66,14 @@ Constructor __init__(AbstractInnerRequest)
 
         AbstractRequestMixin.__init__(self)
 
-        self._parameters_chained = { }
+        self._parameters = ChainMap()
         """
-Chained request parameters
+Request parameters layered above the ones inherited
+        """
+        self._parameters_chained = ChainMap()
+        """
+Chained request parameters layered above the ones inherited
         """
-
-        self.supported_features['listener_data'] = self._supports_listener_data
-        self.supported_features['parameters_chained'] = True
     #
 
     @AbstractRequestMixin.client_host.setter
@@ -88,18 +105,18 @@ Sets the client port.
     @AbstractRequestMixin.parameters.setter
     def parameters(self, parameters):
         """
-Sets all parameters given and if not already defined.
+Sets all parameters given and if not already defined. A copy of the
+parameters given is added as an additional layer.
 
 :param parameters: Request parameters
 
 :since: v1.0.0
         """
 
-        if (len(parameters) > 0):
-            for key in parameters:
-                if (key not in self._parameters): self._parameters[key] = parameters[key]
-            #
-        else: self._parameters = { }
+        if (len(parameters) < 1): self._parameters = ChainMap()
+        elif (parameters is not self._parameters and all(parameters is not _dict for _dict in self._parameters.maps)):
+            self._parameters.maps.append(dict(parameters))
+        #
     #
 
     @property
@@ -107,7 +124,7 @@ Sets all parameters given and if not already defined.
         """
 Return all parameters of a chained request.
 
-:return: (dict) Request parameters chained
+:return: (ChainMap) Request parameters chained
 :since:  v1.0.0
         """
 
@@ -153,6 +170,20 @@ Sets the underlying server scheme.
         self._server_scheme = scheme
     #
 
+    def get_parameter(self, name, default = None):
+        """
+Returns the value for the specified parameter.
+
+:param name: Parameter name
+:param default: Default value if not set
+
+:return: (mixed) Requested value or default one if undefined
+:since:  v1.1.0
+        """
+
+        return AbstractInnerRequest._get_layered_value(self._parameters, name, default)
+    #
+
     def get_parameter_chained(self, name, default = None):
         """
 Returns the value for the specified parameter in a chained request.
@@ -164,7 +195,7 @@ Returns the value for the specified parameter in a chained request.
 :since:  v1.0.0
         """
 
-        return (self._parameters_chained[name] if (name in self._parameters_chained) else default)
+        return AbstractInnerRequest._get_layered_value(self._parameters_chained, name, default)
     #
 
     def init(self, connection_or_request):
@@ -178,8 +209,29 @@ Initializes default values from the a connection or request instance.
 
         AbstractRequestMixin.init(self, connection_or_request)
 
-        parameters = connection_or_request.parameters
-        if (len(parameters) > 0): self.parameters = parameters
+        if (isinstance(connection_or_request, AbstractInnerRequest)):
+            self._parameters.maps.extend(connection_or_request._parameters.maps)
+        else: self._parameters.maps.append(connection_or_request.parameters)
+
+        if (self.__class__._parameters_chained_inherited_ and connection_or_request.is_supported("parameters_chained")):
+            parameters_chained = connection_or_request.parameters_chained
+
+            if (isinstance(parameters_chained, ChainMap)): self._parameters_chained.maps.extend(parameters_chained.maps)
+            else: self._parameters_chained.maps.append(parameters_chained)
+        #
+    #
+
+    def reset(self):
+        """
+Resets all per-request state to allow reusing this instance.
+
+:since: v1.1.0
+        """
+
+        AbstractRequestMixin.reset(self)
+
+        self._parameters = ChainMap()
+        self._parameters_chained = ChainMap()
     #
 
     def set_parameter_chained(self, name, value):
@@ -205,4 +257,44 @@ Returns false if the server address is unknown.
 
         return (self.server_host is not None)
     #
+
+    def unset_parameter(self, name):
+        """
+Removes the specified parameter if defined. Inherited parameters are copied
+into this request once to hide the one removed.
+
+:param name: Parameter name
+
+:since: v1.1.0
+        """
+
+        self._parameters.maps[0].pop(name, None)
+
+        if (name in self._parameters):
+            self._parameters = ChainMap(dict(self._parameters))
+            del(self._parameters[name])
+        #
+    #
+
+    @staticmethod
+    def _get_layered_value(parameters, name, default):
+        """
+Returns the value for the specified parameter from the first layer
+defining it. Layers are checked directly to avoid a raised exception for
+each layer not defining it.
+
+:param parameters: (ChainMap) Layered parameters
+:param name: Parameter name
+:param default: Default value if not set
+
+:return: (mixed) Requested value or default one if undefined
+:since:  v1.1.0
+        """
+
+        for _dict in parameters.maps:
+            if (name in _dict): return _dict[name]
+        #
+
+        return default
+    #
 #
@@ -17,7 +17,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from threading import local
+from contextvars import ContextVar
 from weakref import ref
 
 from dpt_runtime.not_implemented_exception import NotImplementedException
@@ -37,14 +37,18 @@ This abstract class contains common methods for request implementations.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "__weakref__" ] + AbstractRequestMixin._mixin_slots_
+    _supported_features_ = { "listener_data": "_supports_listener_data" }
+    """
+Features supported by instances of this class
+    """
+    __slots__ = [ "__weakref__", "_response" ] + AbstractRequestMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
-    _local = local()
+    _current = ContextVar("pas_server_current_request", default = None)
     """
-Thread-local static object
+Context variable referencing the current request instance
     """
 
     def __init__(self):
@@ -56,9 +60,47 @@ Constructor __init__(AbstractRequest)
 
         AbstractRequestMixin.__init__(self)
 
-        AbstractRequest._local.weakref_instance = ref(self)
+        self._response = None
+        """
+Response instance bound to this request
+        """
+    #
+
+    @property
+    def bound_response(self):
+        """
+Returns the response instance bound to this request.
 
-        self.supported_features['listener_data'] = self._supports_listener_data
+:return: (object) Response object; None if not bound
+:since:  v1.1.0
+        """
+
+        return self._response
+    #
+
+    def bind_response(self, response):
+        """
+Binds the given response instance to this request. The connection releases
+a pooled response bound after the request has been handled.
+
+:param response: Response object
+
+:since: v1.1.0
+        """
+
+        self._response = response
+    #
+
+    def enter_scope(self):
+        """
+Sets this instance as the current request of the executing context until
+"exit_scope()" is called with the token returned.
+
+:return: (object) Context variable token
+:since:  v1.1.0
+        """
+
+        return AbstractRequest._current.set(ref(self))
     #
 
     def execute(self):
@@ -71,6 +113,19 @@ Executes the incoming request.
         raise NotImplementedException()
     #
 
+    def exit_scope(self, token):
+        """
+Restores the current request of the executing context active before
+"enter_scope()" has been called.
+
+:param token: Context variable token
+
+:since: v1.1.0
+        """
+
+        AbstractRequest._current.reset(token)
+    #
+
     def _new_response(self):
         """
 Initializes the matching response instance.
@@ -82,6 +137,18 @@ Initializes the matching response instance.
         raise NotImplementedException()
     #
 
+    def reset(self):
+        """
+Resets all per-request state to allow reusing this instance.
+
+:since: v1.1.0
+        """
+
+        AbstractRequestMixin.reset(self)
+
+        self._response = None
+    #
+
     def _respond(self, response):
         """
 Responds the request with the given instance.
@@ -108,12 +175,13 @@ Returns false if the server address is unknown.
     @staticmethod
     def get_instance():
         """
-Get the AbstractRequest singleton.
+Get the current AbstractRequest instance of the executing context.
 
 :return: (object) Object on success
 :since:  v1.0.0
         """
 
-        return (AbstractRequest._local.weakref_instance() if (hasattr(AbstractRequest._local, "weakref_instance")) else None)
+        instance_ref = AbstractRequest._current.get()
+        return (None if (instance_ref is None) else instance_ref())
     #
 #
@@ -17,11 +17,14 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from types import MappingProxyType
+
 from dpt_runtime.operation_not_supported_exception import OperationNotSupportedException
-from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_runtime.type_exception import TypeException
 
-class AbstractRequestMixin(SupportsMixin):
+from ..class_supports_mixin import ClassSupportsMixin
+
+class AbstractRequestMixin(ClassSupportsMixin):
     """
 Mixin for abstract classes to implement methods only once.
 
@@ -43,9 +46,16 @@ Mixin for abstract classes to implement methods only once.
                       "_server_port",
                       "_server_scheme",
                       "_stream_response"
-                    ] + SupportsMixin._mixin_slots_
+                    ] + ClassSupportsMixin._mixin_slots_
     """
 Additional __slots__ used for inherited classes.
+    """
+    _supported_features_ = { "connection_data": "_supports_connection_data",
+                             "connection_parameters": "_supports_connection_parameters",
+                             "stream_response": "_supports_stream_response"
+                           }
+    """
+Features supported by instances of this class
     """
     __slots__ = [ ]
     """
@@ -60,7 +70,7 @@ Constructor __init__(AbstractRequest)
 :since: v1.0.0
         """
 
-        SupportsMixin.__init__(self)
+        ClassSupportsMixin.__init__(self)
 
         self._client_host = None
         """
@@ -99,10 +109,6 @@ Server scheme / protocol
         """
 Stream response instance
         """
-
-        self.supported_features['connection_data'] = self._supports_connection_data
-        self.supported_features['connection_parameters'] = self._supports_connection_parameters
-        self.supported_features['stream_response'] = self._supports_stream_response
     #
 
     @property
@@ -168,13 +174,14 @@ Returns the LogHandler.
     @property
     def parameters(self):
         """
-Return all parameters received.
+Return a read-only view of all parameters received. Use
+"get_parameters_snapshot()" for a private copy.
 
-:return: (dict) Request parameters
+:return: (Mapping) Request parameters
 :since:  v1.0.0
         """
 
-        return self._parameters.copy()
+        return MappingProxyType(self._parameters)
     #
 
     @property
@@ -240,6 +247,17 @@ Returns the value for the specified parameter.
         return self._parameters.get(name, default)
     #
 
+    def get_parameters_snapshot(self):
+        """
+Returns a copy of all parameters received.
+
+:return: (dict) Request parameters
+:since:  v1.1.0
+        """
+
+        return dict(self._parameters)
+    #
+
     def init(self, connection_or_request):
         """
 Initializes default values from the a connection or request instance.
@@ -273,6 +291,26 @@ Initializes default values from the a connection or request instance.
         #
     #
 
+    def reset(self):
+        """
+Resets all per-request state to allow reusing this instance.
+
+:since: v1.1.0
+        """
+
+        self.supported_features = { }
+
+        self._client_host = None
+        self._client_port = None
+        self._connection_parameters = None
+        self._log_handler = None
+        self._parameters = { }
+        self._server_host = None
+        self._server_port = None
+        self._server_scheme = None
+        self._stream_response = None
+    #
+
     def set_parameter(self, name, value):
         """
 Sets the value for the specified parameter.
@@ -320,4 +358,28 @@ connection.
         try: return (self.stream_response is not None)
         except OperationNotSupportedException: return False
     #
+
+    def unset_parameter(self, name):
+        """
+Removes the specified parameter if defined.
+
+:param name: Parameter name
+
+:since: v1.1.0
+        """
+
+        self._parameters.pop(name, None)
+    #
+
+    def update_parameters(self, parameters):
+        """
+Sets the values for all parameters given.
+
+:param parameters: (dict) Request parameters
+
+:since: v1.1.0
+        """
+
+        self._parameters.update(parameters)
+    #
 #
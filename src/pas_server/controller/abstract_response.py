@@ -17,7 +17,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from threading import local
+from contextvars import ContextVar
 from weakref import ref
 
 try: from collections.abc import Mapping
@@ -25,12 +25,13 @@ except ImportError: from collections import Mapping
 
 from dpt_runtime.io_exception import IOException
 from dpt_runtime.not_implemented_exception import NotImplementedException
-from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_settings import Settings
 
+from .abstract_request import AbstractRequest
 from .abstract_request_mixin import AbstractRequestMixin
+from ..class_supports_mixin import ClassSupportsMixin
 
-class AbstractResponse(SupportsMixin):
+class AbstractResponse(ClassSupportsMixin):
     """
 This abstract class contains common methods for response implementations.
 
@@ -43,14 +44,20 @@ This abstract class contains common methods for response implementations.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "__weakref__", "_connection_parameters", "_log_handler" ] + SupportsMixin._mixin_slots_
+    _supported_features_ = { "connection_parameters": "_supports_connection_parameters",
+                             "connection_settings": "_supports_connection_parameters"
+                           }
+    """
+Features supported by instances of this class
+    """
+    __slots__ = [ "__weakref__", "_connection_parameters", "_log_handler" ] + ClassSupportsMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
-    _local = local()
+    _current = ContextVar("pas_server_current_response", default = None)
     """
-Thread-local static object
+Context variable referencing the current response instance
     """
 
     def __init__(self):
@@ -60,7 +67,7 @@ Constructor __init__(AbstractResponse)
 :since: v1.0.0
         """
 
-        SupportsMixin.__init__(self)
+        ClassSupportsMixin.__init__(self)
 
         self._connection_parameters = None
         """
@@ -71,11 +78,6 @@ Response linked connection parameters
 The LogHandler is called whenever debug messages should be logged or errors
 happened.
         """
-
-        AbstractResponse._local.weakref_instance = ref(self)
-
-        self.supported_features['connection_parameters'] = self._supports_connection_parameters
-        self.supported_features['connection_settings'] = self._supports_connection_parameters
     #
 
     @property
@@ -128,6 +130,31 @@ Returns the LogHandler.
         return self._log_handler
     #
 
+    def enter_scope(self):
+        """
+Sets this instance as the current response of the executing context until
+"exit_scope()" is called with the token returned.
+
+:return: (object) Context variable token
+:since:  v1.1.0
+        """
+
+        return AbstractResponse._current.set(ref(self))
+    #
+
+    def exit_scope(self, token):
+        """
+Restores the current response of the executing context active before
+"enter_scope()" has been called.
+
+:param token: Context variable token
+
+:since: v1.1.0
+        """
+
+        AbstractResponse._current.reset(token)
+    #
+
     def handle_critical_error(self, message):
         """
 "handle_critical_error()" is called to send a critical error message.
@@ -169,7 +196,9 @@ send.
 
     def init(self, connection_or_request):
         """
-Initializes default values from the a connection or request instance.
+Initializes default values from the a connection or request instance. The
+response becomes the current one of the executing context until the scope
+of the request handled is left.
 
 :param connection_or_request: Connection or request instance
 
@@ -183,6 +212,23 @@ Initializes default values from the a connection or request instance.
         #
 
         self._log_handler = connection_or_request.log_handler
+
+        if (isinstance(connection_or_request, AbstractRequest)): connection_or_request.bind_response(self)
+
+        self.enter_scope()
+    #
+
+    def reset(self):
+        """
+Resets all per-request state to allow reusing this instance.
+
+:since: v1.1.0
+        """
+
+        self.supported_features = { }
+
+        self._connection_parameters = None
+        self._log_handler = None
     #
 
     def send(self):
@@ -216,22 +262,51 @@ Returns false if no connection parameters are initialized.
         return (self._connection_parameters is not None)
     #
 
+    @staticmethod
+    def enter_request_scope():
+        """
+Starts the scope of a request handled without a current response.
+Responses initialized while handling it stay the current one of the
+executing context until "exit_request_scope()" is called with the token
+returned.
+
+:return: (object) Context variable token
+:since:  v1.1.0
+        """
+
+        return AbstractResponse._current.set(None)
+    #
+
+    @staticmethod
+    def exit_request_scope(token):
+        """
+Restores the current response of the executing context active before
+"enter_request_scope()" has been called.
+
+:param token: Context variable token
+
+:since: v1.1.0
+        """
+
+        AbstractResponse._current.reset(token)
+    #
     @staticmethod
     def get_instance():
         """
-Get the AbstractResponse singleton.
+Get the current AbstractResponse instance of the executing context.
 
 :return: (object) Object on success
 :since:  v1.0.0
         """
 
-        return (AbstractResponse._local.weakref_instance() if (hasattr(AbstractResponse._local, "weakref_instance")) else None)
+        instance_ref = AbstractResponse._current.get()
+        return (None if (instance_ref is None) else instance_ref())
     #
 
     @staticmethod
     def get_instance_store():
         """
-Get the response store of the response singleton.
+Get the response store of the current response instance.
 
 :return: (dict) Response store
 :since:  v1.0.0
@@ -240,4 +315,5 @@ Get the response store of the response singleton.
         instance = AbstractResponse.get_instance()
         return (None if (instance is None) else instance.store)
     #
+
 #
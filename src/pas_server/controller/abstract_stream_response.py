@@ -22,14 +22,17 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 try: from collections.abc import Iterator
 except ImportError: from collections import Iterator
 
+from stat import S_ISREG
+import os
+
 from dpt_runtime.binary import Binary
 from dpt_runtime.not_implemented_exception import NotImplementedException
-from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_runtime.value_exception import ValueException
 
 from .abstract_request_mixin import AbstractRequestMixin
+from ..class_supports_mixin import ClassSupportsMixin
 
-class AbstractStreamResponse(SupportsMixin):
+class AbstractStreamResponse(ClassSupportsMixin):
     """
 A stream response reads data from a streamer and writes it to a response object.
 
@@ -64,7 +67,7 @@ Do not stream content
                   "stream_mode",
                   "stream_mode_supported",
                   "_streamer"
-                ] + SupportsMixin._mixin_slots_
+                ] + ClassSupportsMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -77,7 +80,7 @@ Constructor __init__(AbstractStreamResponse)
 :since: v1.0.0
         """
 
-        SupportsMixin.__init__(self)
+        ClassSupportsMixin.__init__(self)
 
         self._active = True
         """
@@ -238,6 +241,8 @@ Send data in cache.
 
         if (self._active):
             if (self.streamer is not None and (not self.stream_mode & AbstractStreamResponse.STREAM_ITERATOR)):
+                if (self.stream_mode != AbstractStreamResponse.STREAM_NONE): self._send_streamer_file()
+
                 while (not self.streamer.is_eof):
                     data = self.streamer.read()
 
@@ -251,6 +256,34 @@ Send data in cache.
         #
     #
 
+    def _send_streamer_file(self):
+        """
+Sends the range of a regular file reported by the streamer with
+"get_raw_file_range()" using "_write_file()". Other streamers are always
+read as their data may be transformed while reading. The streamer is moved
+forward by the number of bytes sent to continue with reading the remaining
+data if any.
+
+:since: v1.1.0
+        """
+
+        file_range = (self.streamer.get_raw_file_range() if (hasattr(self.streamer, "get_raw_file_range")) else None)
+
+        if (file_range is not None):
+            ( file_descriptor, offset, count ) = file_range
+
+            if (count > 0 and S_ISREG(os.fstat(file_descriptor).st_mode)):
+                if (self._data is not None):
+                    self._write(self._data)
+                    self._data = None
+                #
+
+                sent_size = self._write_file(file_descriptor, offset, count)
+                if (sent_size > 0): self.streamer.seek(offset + sent_size)
+            #
+        #
+    #
+
     def send_data(self, data):
         """
 Sends the given data as part of the response.
@@ -281,4 +314,21 @@ Writes the given data.
 
         raise NotImplementedException()
     #
+
+    def _write_file(self, file_descriptor, offset, count):
+        """
+Writes the given range of the file descriptor without reading it into
+memory first. Implementations capable of it (e.g. based on "os.sendfile()")
+should override this method and raise an exception if writing failed.
+
+:param file_descriptor: File descriptor to read from
+:param offset: Offset to start reading from
+:param count: Number of bytes to write
+
+:return: (int) Number of bytes written; 0 if not supported
+:since:  v1.1.0
+        """
+
+        return 0
+    #
 #
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.stacked_dict import StackedDict
+from dpt_settings import Settings
+
+class ConnectionSettings(StackedDict):
+    """
+Connection settings are a copy-on-write overlay of the process-wide
+settings. All instances share the same read-only base layer; a dict for
+connection specific values and a list of stacked dicts are only allocated
+if they are modified or "stacked_dicts" is accessed.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _shared_stacked_dicts = ( )
+    """
+Stacked dicts shared by all instances containing the settings dict
+    """
+
+    __slots__ = [ "_stacked_dicts" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(ConnectionSettings)
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=super-init-not-called
+
+        self._dict = None
+        """
+Connection specific settings; None if not modified
+        """
+        self._stacked_dicts = ConnectionSettings._get_shared_stacked_dicts()
+        """
+Stacked additional dicts to be looked in; a tuple shared by all instances
+until "stacked_dicts" is accessed.
+        """
+    #
+
+    def __contains__(self, item):
+        """
+python.org: Called to implement membership test operators.
+
+:param item: Item to be looked up
+
+:return: (bool) True if item is in self or a stacked dict.
+:since:  v1.1.0
+        """
+
+        _return = (self._dict is not None and item in self._dict)
+
+        if (not _return):
+            for _dict in self._stacked_dicts:
+                if (item in _dict):
+                    _return = True
+                    break
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def __delitem__(self, key):
+        """
+python.org: Called to implement deletion of self[key].
+
+:param key: Key
+
+:since: v1.1.0
+        """
+
+        if (self._dict is None): raise KeyError(key)
+        del(self._dict[key])
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Key
+
+:return: (mixed) Value
+:since:  v1.1.0
+        """
+
+        if (self._dict is not None and key in self._dict): return self._dict[key]
+
+        for _dict in self._stacked_dicts:
+            if (key in _dict): return _dict[key]
+        #
+
+        raise KeyError(key)
+    #
+
+    def __setitem__(self, key, value):
+        """
+python.org: Called to implement assignment to self[key].
+
+:param key: Key
+:param value: Value
+
+:since: v1.1.0
+        """
+
+        if (self._dict is None): self._dict = { }
+        self._dict[key] = value
+    #
+
+    @property
+    def stacked_dicts(self):
+        """
+Returns the list of stacked additional dicts to be looked in. The shared
+stacked dicts are copied into a list of this instance on first access.
+
+:return: (list) Stacked dicts
+:since:  v1.1.0
+        """
+
+        if (type(self._stacked_dicts) is not list): self._stacked_dicts = list(self._stacked_dicts)
+        return self._stacked_dicts
+    #
+
+    @stacked_dicts.setter
+    def stacked_dicts(self, stacked_dicts):
+        """
+Sets the list of stacked additional dicts to be looked in.
+
+:param stacked_dicts: List of stacked dicts
+
+:since: v1.1.0
+        """
+
+        self._stacked_dicts = stacked_dicts
+    #
+
+    def add_dict(self, _dict, prepend = False):
+        """
+Adds the given Python dictionary to the stack.
+
+:param _dict: Dictionary
+:param prepend: Prepend dictionary
+
+:since: v1.1.0
+        """
+
+        if (_dict is not self._dict and all(_dict is not stacked_dict for stacked_dict in self._stacked_dicts)):
+            if (prepend): self.stacked_dicts.insert(0, _dict)
+            else: self.stacked_dicts.append(_dict)
+        #
+    #
+
+    def _get_unique_keys(self):
+        """
+Returns a list of unique keys for this stacked dictionary.
+
+:return: (list) Keys
+:since:  v1.1.0
+        """
+
+        _return = ([ ] if (self._dict is None) else list(self._dict.keys()))
+        keys = set(_return)
+
+        for _dict in self._stacked_dicts:
+            for key in _dict:
+                if (key not in keys):
+                    _return.append(key)
+                    keys.add(key)
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def remove_dict(self, _dict):
+        """
+Removes the given Python dictionary from the stack.
+
+:param _dict: Dictionary
+
+:since: v1.1.0
+        """
+
+        stacked_dicts = [ stacked_dict for stacked_dict in self._stacked_dicts if stacked_dict is not _dict ]
+        if (len(stacked_dicts) != len(self._stacked_dicts)): self._stacked_dicts = stacked_dicts
+    #
+
+    @staticmethod
+    def _get_shared_stacked_dicts():
+        """
+Returns the stacked dicts shared by all instances. They are renewed if the
+settings dict instance has been replaced.
+
+:return: (tuple) Shared stacked dicts
+:since:  v1.1.0
+        """
+
+        settings_dict = Settings.get_dict()
+        _return = ConnectionSettings._shared_stacked_dicts
+
+        if (len(_return) < 1 or _return[0] is not settings_dict):
+            _return = ( settings_dict, )
+            ConnectionSettings._shared_stacked_dicts = _return
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def is_setting_enabled(key, default = False):
+        """
+Returns true if the boolean process-wide setting given is enabled. Values
+configured as strings are only enabled for "1", "t", "true" or "yes".
+
+:param key: Setting key
+:param default: Default value if the setting is not configured
+
+:return: (bool) True if enabled
+:since:  v1.1.0
+        """
+
+        value = Settings.get(key, default)
+
+        return (value
+                if (isinstance(value, bool)) else
+                (str(value).strip().lower() in ( "1", "t", "true", "yes" ))
+               )
+    #
+#
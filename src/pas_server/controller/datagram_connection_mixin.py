@@ -34,6 +34,10 @@ connection instance.
     _mixin_slots_ = [ "_datagram_data" ]
     """
 Additional __slots__ used for inherited classes.
+    """
+    _supported_features_ = { "datagram_data": True }
+    """
+Features supported by instances of this class
     """
     __slots__ = [ ]
     """
@@ -52,8 +56,6 @@ Constructor __init__(DatagramConnectionMixin)
         """
 Datagram data received
         """
-
-        self.supported_features['datagram_data'] = True
     #
 
     @property
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.io_exception import IOException
+
+from .abstract_stream_response import AbstractStreamResponse
+
+class DispatchedStreamResponse(AbstractStreamResponse):
+    """
+This stream response instance writes all data to the socket of a dispatched
+connection. Raw file ranges reported by streamers are sent with
+"os.sendfile()" if supported.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_connection" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, connection):
+        """
+Constructor __init__(DispatchedStreamResponse)
+
+:param connection: Dispatched connection instance
+
+:since: v1.1.0
+        """
+
+        self._connection = connection
+        """
+Dispatched connection instance written to
+        """
+
+        AbstractStreamResponse.__init__(self)
+
+        self.stream_mode = AbstractStreamResponse.STREAM_DIRECT
+        self.stream_mode_supported |= AbstractStreamResponse.STREAM_DIRECT
+    #
+
+    def finish(self):
+        """
+Finish transmission and cleanup resources.
+
+:since: v1.1.0
+        """
+
+        try: AbstractStreamResponse.finish(self)
+        finally: self._connection = None
+    #
+
+    def _write(self, data):
+        """
+Writes the given data.
+
+:param data: Data to be send
+
+:since: v1.1.0
+        """
+
+        if (self._connection is None or (not self._connection.write_data(data))): raise IOException("Failed to write data to the connection")
+    #
+
+    def _write_file(self, file_descriptor, offset, count):
+        """
+Writes the given range of the file descriptor to the connection socket.
+
+:param file_descriptor: File descriptor to read from
+:param offset: Offset to start reading from
+:param count: Number of bytes to write
+
+:return: (int) Number of bytes written; 0 if not supported
+:since:  v1.1.0
+        """
+
+        if (self._connection is None or self._connection.socket is None): return 0
+        if (not self._connection.write_file(file_descriptor, offset, count)): raise IOException("Failed to write file data to the connection")
+
+        return count
+    #
+#
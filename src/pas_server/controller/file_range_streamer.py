@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from stat import S_ISREG
+import os
+
+from dpt_runtime.value_exception import ValueException
+
+class FileRangeStreamer(object):
+    """
+The file range streamer reads the raw bytes of a given range of a file.
+Stream responses capable of it send the range with "os.sendfile()" as
+reported by "get_raw_file_range()" instead of reading it.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_end", "_file", "_file_descriptor", "_position" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, _file, offset = 0, size = None):
+        """
+Constructor __init__(FileRangeStreamer)
+
+:param _file: File object providing "fileno()" or an opened "handle"
+              (e.g. "dpt_file.File") for the file to read
+:param offset: Offset of the range in bytes
+:param size: Size of the range in bytes; None for the remaining file
+
+:since: v1.1.0
+        """
+
+        handle = getattr(_file, "handle", _file)
+        if (handle is None or (not hasattr(handle, "fileno"))): raise ValueException("Given file object is not supported")
+
+        self._file = _file
+        """
+File object read from
+        """
+        self._file_descriptor = handle.fileno()
+        """
+File descriptor read from
+        """
+        self._position = offset
+        """
+Offset of the next byte to read
+        """
+
+        file_size = os.fstat(self._file_descriptor).st_size
+
+        self._end = (file_size if (size is None) else min(offset + size, file_size))
+        """
+Offset of the end of the range
+        """
+
+        if (offset < 0 or self._end < offset): raise ValueException("Given file range is invalid")
+    #
+
+    @property
+    def is_eof(self):
+        """
+Returns true if the end of the range has been reached.
+
+:return: (bool) True if EOF
+:since:  v1.1.0
+        """
+
+        return (self._position >= self._end)
+    #
+
+    def close(self):
+        """
+Closes the underlying file object.
+
+:since: v1.1.0
+        """
+
+        if (self._file is not None and hasattr(self._file, "close")): self._file.close()
+        self._file = None
+    #
+
+    def get_raw_file_range(self):
+        """
+Returns the file descriptor and remaining range of raw bytes if the file is
+a regular one.
+
+:return: (tuple) File descriptor, offset and number of bytes; None if not
+         a regular file
+:since:  v1.1.0
+        """
+
+        return (( self._file_descriptor, self._position, self._end - self._position )
+                if (S_ISREG(os.fstat(self._file_descriptor).st_mode)) else
+                None
+               )
+    #
+
+    def read(self, n = 65536):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position
+
+:return: (bytes) Data; None if EOF
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        if (self._position < self._end):
+            size = min(n, self._end - self._position)
+
+            if (hasattr(os, "pread")): _return = os.pread(self._file_descriptor, size, self._position)
+            else:
+                os.lseek(self._file_descriptor, self._position, os.SEEK_SET)
+                _return = os.read(self._file_descriptor, size)
+            #
+
+            if (len(_return) < 1): self._end = self._position
+            self._position += len(_return)
+        #
+
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given file offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.1.0
+        """
+
+        self._position = offset
+        return self._position
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.1.0
+        """
+
+        return self._position
+    #
+#
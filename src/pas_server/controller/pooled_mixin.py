@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import local, Lock
+from weakref import ref
+
+from dpt_logging import LogLine
+from dpt_settings import Settings
+
+from .connection_settings import ConnectionSettings
+
+class PooledMixin(object):
+    """
+"PooledMixin" lets request and response classes reuse released instances
+instead of constructing new ones. Instances are taken with "acquire()" and
+given back with "release()" resetting all per-request state. Instances
+released more than once are ignored. Each worker thread keeps a bounded pool
+per class. If debug mode is enabled instances garbage collected without
+being released are logged as leaked.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _mixin_slots_ = [ "_pool_released" ]
+    """
+Additional __slots__ used for inherited classes.
+    """
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _pool_local = local()
+    """
+Thread-local static object containing the pools of the current worker
+    """
+    _pool_outstanding = { }
+    """
+Instances acquired but not yet released if debug mode is enabled
+    """
+    _pool_outstanding_lock = Lock()
+    """
+Lock used to protect the outstanding instances dict
+    """
+    _pool_size_max_ = None
+    """
+Maximum number of released instances kept per worker; None to use the
+configured value
+    """
+
+    def release(self):
+        """
+Resets the instance and gives it back to the pool of the current worker.
+
+:since: v1.1.0
+        """
+
+        _class = self.__class__
+
+        if (getattr(self, "_pool_released", False)):
+            LogLine.warning("{0!r} has been released more than once", self, context = "pas_server")
+            return
+        #
+
+        if (_class._is_pool_debug_mode()):
+            with PooledMixin._pool_outstanding_lock:
+                is_outstanding = (PooledMixin._pool_outstanding.pop(id(self), None) is not None)
+            #
+
+            if (not is_outstanding):
+                LogLine.warning("{0!r} has been released without being acquired before", self, context = "pas_server")
+                return
+            #
+        #
+
+        self._pool_released = True
+        self.reset()
+
+        pool = _class._get_pool()
+        if (len(pool) < _class._get_pool_size_max()): pool.append(self)
+    #
+
+    @classmethod
+    def acquire(cls):
+        """
+Returns a released instance of this class from the pool of the current
+worker or a new one if none is available.
+
+:return: (object) Instance
+:since:  v1.1.0
+        """
+
+        pool = cls._get_pool()
+        _return = (pool.pop() if (len(pool) > 0) else cls())
+        _return._pool_released = False
+
+        if (cls._is_pool_debug_mode()):
+            _id = id(_return)
+            class_name = cls.__name__
+
+            def _on_leaked(_ref):
+                with PooledMixin._pool_outstanding_lock:
+                    if (PooledMixin._pool_outstanding.get(_id) is _ref): del(PooledMixin._pool_outstanding[_id])
+                    else: return
+                #
+
+                LogLine.warning("{0} instance has been garbage collected without being released", class_name, context = "pas_server")
+            #
+
+            with PooledMixin._pool_outstanding_lock:
+                PooledMixin._pool_outstanding[_id] = ref(_return, _on_leaked)
+            #
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_pool(cls):
+        """
+Returns the pool of released instances for this class and the current
+worker.
+
+:return: (list) Pool of released instances
+:since:  v1.1.0
+        """
+
+        pools = getattr(PooledMixin._pool_local, "pools", None)
+
+        if (pools is None):
+            pools = { }
+            PooledMixin._pool_local.pools = pools
+        #
+
+        _return = pools.get(cls)
+
+        if (_return is None):
+            _return = [ ]
+            pools[cls] = _return
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def _get_pool_size_max(cls):
+        """
+Returns the maximum number of released instances kept per worker.
+
+:return: (int) Maximum pool size
+:since:  v1.1.0
+        """
+
+        return (int(Settings.get("pas_global_server_object_pool_size_max", 16))
+                if (cls._pool_size_max_ is None) else
+                cls._pool_size_max_
+               )
+    #
+
+    @staticmethod
+    def _is_pool_debug_mode():
+        """
+Returns true if acquired instances should be tracked to detect leaks.
+
+:return: (bool) True if debug mode is enabled
+:since:  v1.1.0
+        """
+
+        return ConnectionSettings.is_setting_enabled("pas_global_server_object_pool_debug")
+    #
+#
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition
+from time import time
+
+from dpt_logging import LogLine
+from dpt_threading.thread import Thread
+
+class WriteBufferFlusher(object):
+    """
+The write buffer flusher calls "flush_expired_write_buffer()" of scheduled
+connections once their write buffer timeout has passed. A single daemon
+thread is shared by all connections and started on first use.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=broad-except
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _condition = Condition()
+    """
+Condition used to signal newly scheduled connections
+    """
+    _queue = [ ]
+    """
+Heap of scheduled timestamps and connections
+    """
+    _sequence = count()
+    """
+Sequence used to order connections scheduled for the same timestamp
+    """
+    _thread = None
+    """
+Flusher thread
+    """
+
+    @staticmethod
+    def _run():
+        """
+Flusher thread main loop.
+
+:since: v1.1.0
+        """
+
+        while (True):
+            with WriteBufferFlusher._condition:
+                while (len(WriteBufferFlusher._queue) < 1): WriteBufferFlusher._condition.wait()
+
+                timeout = WriteBufferFlusher._queue[0][0] - time()
+
+                if (timeout > 0):
+                    WriteBufferFlusher._condition.wait(timeout)
+                    continue
+                #
+
+                ( _, _, connection ) = heappop(WriteBufferFlusher._queue)
+            #
+
+            try: connection.flush_expired_write_buffer()
+            except Exception as handled_exception: LogLine.error(handled_exception, context = "pas_server")
+
+            del(connection)
+        #
+    #
+
+    @staticmethod
+    def schedule(connection, timestamp):
+        """
+Schedules the given connection to be flushed at the given time.
+
+:param connection: Connection instance
+:param timestamp: UNIX timestamp to flush the connection at
+
+:since: v1.1.0
+        """
+
+        with WriteBufferFlusher._condition:
+            heappush(WriteBufferFlusher._queue, ( timestamp, next(WriteBufferFlusher._sequence), connection ))
+
+            if (WriteBufferFlusher._thread is None or (not WriteBufferFlusher._thread.is_alive())):
+                WriteBufferFlusher._thread = Thread(target = WriteBufferFlusher._run, daemon = True)
+                WriteBufferFlusher._thread.start()
+            #
+
+            WriteBufferFlusher._condition.notify()
+        #
+    #
+#
@@ -18,4 +18,4 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 """
 
 try: from .aio_dispatcher import AioDispatcher as Dispatcher
-except ImportError: from .asyncore_dispatcher import AsyncoreDispatcher as Dispatcher
+except ImportError: from .selectors_dispatcher import SelectorsDispatcher as Dispatcher
@@ -20,14 +20,14 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 from weakref import proxy, ProxyTypes
 
 from dpt_module_loader import NamedClassLoader
-from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_runtime.not_implemented_exception import NotImplementedException
 from dpt_runtime.operation_not_supported_exception import OperationNotSupportedException
 
+from ..class_supports_mixin import ClassSupportsMixin
 from ..controller.abstract_request import AbstractRequest
 from ..controller.abstract_response import AbstractResponse
 
-class Abstract(SupportsMixin):
+class Abstract(ClassSupportsMixin):
     """
 "Abstract" provides methods for module and service based implementations.
 
@@ -45,7 +45,7 @@ class Abstract(SupportsMixin):
                   "_log_handler",
                   "request",
                   "response"
-                ] + SupportsMixin._mixin_slots_
+                ] + ClassSupportsMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -58,7 +58,7 @@ Constructor __init__(Abstract)
 :since: v1.0.0
         """
 
-        SupportsMixin.__init__(self)
+        ClassSupportsMixin.__init__(self)
 
         self._executable_method_name = None
         """
@@ -37,6 +37,12 @@ result is returned to the executor.
     _mixin_slots_ = [ "_context", "_result" ]
     """
 Additional __slots__ used for inherited classes.
+    """
+    _supported_features_ = { "context": True,
+                             "result_generator": True
+                           }
+    """
+Features supported by instances of this class
     """
     __slots__ = [ ]
     """
@@ -59,9 +65,6 @@ Executable method context
         """
 Executable method result
         """
-
-        self.supported_features['context'] = True
-        self.supported_features['result_generator'] = True
     #
 
     @property
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from functools import partial
+from selectors import DefaultSelector, EVENT_READ
+from socket import socketpair, AF_UNIX
+import errno
+import socket
+import time
+
+from dpt_plugins import Hook
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.traced_exception import TracedException
+from dpt_settings import Settings
+from dpt_threading.thread import Thread
+
+from .abstract_dispatcher import AbstractDispatcher
+from .controller import ConnectionSettings
+from .shutdown_exception import ShutdownException
+
+class SelectorsDispatcher(AbstractDispatcher):
+    """
+The server dispatcher allows an application to provide threaded connections
+and communication. This implementation is based on "selectors" and uses the
+most efficient mechanism of the platform (e.g. "epoll" on Linux). Accepted
+sockets are registered as well and only handed to a worker thread once they
+become readable. Sockets waiting to become readable count against the
+backlog and are closed after the socket data timeout.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=unused-argument
+
+    __slots__ = [ "_dispatch_on_readable",
+                  "_parked_sockets",
+                  "_parked_timeout",
+                  "_selector",
+                  "_wakeup_sockets"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, listener_socket, active_connection_class, threads_active = 5, backlog_max = 10, thread_stopping_hook = None):
+        """
+Constructor __init__(SelectorsDispatcher)
+
+:param listener_socket: Listener socket
+:param active_connection_class: Thread class to be initialized for activated connections
+:param threads_active: Allowed simultaneous threads
+:param backlog_max: Allowed queued connections waiting for a thread
+:param thread_stopping_hook: Thread stopping hook definition
+
+:since: v1.1.0
+        """
+
+        AbstractDispatcher.__init__(self, listener_socket, active_connection_class, threads_active, backlog_max, thread_stopping_hook)
+
+        self._dispatch_on_readable = ConnectionSettings.is_setting_enabled("pas_global_server_dispatch_on_readable", True)
+        """
+True to activate accepted connections only after they became readable.
+Protocols where the server sends data first require this to be disabled.
+        """
+        self._parked_sockets = { }
+        """
+Accepted sockets waiting to become readable and their deadline in the
+order accepted
+        """
+        self._parked_timeout = int(Settings.get("global_server_socket_data_timeout", -1))
+        """
+Time in seconds accepted sockets may wait to become readable
+        """
+
+        if (self._parked_timeout < 1): self._parked_timeout = int(Settings.get("global_socket_data_timeout", 30))
+        self._selector = None
+        """
+Selector instance of the main loop
+        """
+        self._wakeup_sockets = None
+        """
+Socket pair used to wake up the main loop
+        """
+    #
+
+    def _close_expired_parked_sockets(self):
+        """
+Closes accepted sockets that have not become readable before their
+deadline.
+
+:since: v1.1.0
+        """
+
+        _time = time.time()
+
+        for ( sock, deadline ) in list(self._parked_sockets.items()):
+            if (deadline > _time): break
+
+            del(self._parked_sockets[sock])
+            self._selector.unregister(sock)
+
+            if (self._remove_active_socket(sock) and self._log_handler is not None):
+                self._log_handler.debug("{0!r} closed '{1!r}' not being readable in time", self, sock, context = "pas_server")
+            #
+        #
+    #
+
+    def _get_parked_sockets_timeout(self):
+        """
+Returns the time to wait for events until the next accepted socket waiting
+to become readable expires.
+
+:return: (float) Timeout in seconds; None to wait without timeout
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        if (len(self._parked_sockets) > 0):
+            _return = max(0, next(iter(self._parked_sockets.values())) - time.time())
+        #
+
+        return _return
+    #
+
+    def handle_accept(self):
+        """
+Called if the listener socket is readable. Up to
+"pas_global_server_accept_batch_size" pending connections are accepted per
+call.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        accepted_count = 0
+
+        while (self.is_active and self._listener_handle_connections and accepted_count < self._accept_batch_max):
+            socket_data = None
+
+            try: socket_data = self._listener_socket.accept()
+            except BlockingIOError: pass
+            except Exception as handled_exception:
+                if (not self.is_active): pass
+                elif (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+
+            if (socket_data is None): break
+
+            self.handle_accepted(socket_data[0], socket_data[1])
+            accepted_count += 1
+        #
+    #
+
+    def handle_accepted(self, sock, addr):
+        """
+Called if a connection has been established with a new remote endpoint.
+
+:param sock: Socket of the established connection
+:param addr: Address of the remote endpoint
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self.is_active and self._listener_handle_connections):
+            try:
+                if (not self._dispatch_on_readable):
+                    if (self._add_active_socket(sock)): self._activate_connection(sock)
+                elif (self._backlog_max > 0
+                      and len(self._parked_sockets) + self._worker_pool.queue_size >= self._backlog_max
+                     ):
+                    if (self._log_handler is not None): self._log_handler.debug("{0!r} rejected '{1!r}' with backlog exhausted", self, sock, context = "pas_server")
+
+                    try: sock.close()
+                    except socket.error: pass
+                elif (self._add_active_socket(sock)):
+                    self._selector.register(sock, EVENT_READ, partial(self._handle_accepted_readable, sock))
+                    self._parked_sockets[sock] = (time.time() + self._parked_timeout)
+                #
+            except ShutdownException as handled_exception:
+                exception = handled_exception.cause
+
+                if (exception is None and self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                else: handled_exception.print_stack_trace()
+            except Exception as handled_exception:
+                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+        #
+    #
+
+    def _handle_accepted_readable(self, sock):
+        """
+Called if an accepted socket registered to the selector became readable.
+
+:param sock: Socket of the established connection
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        try:
+            self._parked_sockets.pop(sock, None)
+            self._selector.unregister(sock)
+
+            if (self.is_active): self._activate_connection(sock)
+        except ShutdownException as handled_exception:
+            exception = handled_exception.cause
+
+            if (exception is None and self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+            else: handled_exception.print_stack_trace()
+        except Exception as handled_exception:
+            if (self._log_handler is None): TracedException.print_current_stack_trace()
+            else: self._log_handler.error(handled_exception, context = "pas_server")
+        #
+    #
+
+    def handle_read(self):
+        """
+Called if the datagram listener socket is readable.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if ((not self._listener_handle_connections) and self.is_active):
+            try:
+                datagram = self._receive_datagram()
+
+                if (datagram is not None and self._add_active_socket(self._listener_socket)):
+                    self._activate_datagram_connection(self._listener_socket, datagram[0], datagram[1])
+                #
+            except ShutdownException as handled_exception:
+                exception = handled_exception.cause
+
+                if (exception is None and self._log_handler is not None): self._log_handler.error(handled_exception, context = "pas_server")
+                else: handled_exception.print_stack_trace()
+            except Exception as handled_exception:
+                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+        #
+    #
+
+    def run(self):
+        """
+Run the main loop for this server instance.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.run()- (#echo(__LINE__)#)", self, context = "pas_server")
+
+        if (not self.is_active):
+            with self._lock:
+                # Thread safety
+                if (self.is_active): raise IOException("pas.server.Dispatcher has been executed multiple times")
+                self._active = True
+            #
+        #
+
+        self._selector = DefaultSelector()
+        self._wakeup_sockets = socketpair()
+
+        try:
+            self._init()
+            if (self._listener_handle_connections): self._start_listening()
+
+            self._listener_socket.setblocking(False)
+            self._wakeup_sockets[0].setblocking(False)
+
+            self._selector.register(self._listener_socket,
+                                    EVENT_READ,
+                                    (self.handle_accept if (self._listener_handle_connections) else self.handle_read)
+                                   )
+
+            self._selector.register(self._wakeup_sockets[0], EVENT_READ)
+
+            while (self.is_active):
+                for ( key, _ ) in self._selector.select(self._get_parked_sockets_timeout()):
+                    if (key.data is None):
+                        try: key.fileobj.recv(64)
+                        except BlockingIOError: pass
+                    elif (self.is_active): key.data()
+                #
+
+                if (len(self._parked_sockets) > 0 and self.is_active): self._close_expired_parked_sockets()
+            #
+        except ShutdownException as handled_exception:
+            if (self.is_active):
+                exception = handled_exception.cause
+                if (exception is not None and self._log_handler is not None): self._log_handler.error(exception, context = "pas_server")
+            #
+        except Exception as handled_exception:
+            if (isinstance(handled_exception, OSError) and handled_exception.errno == errno.EBADF): pass
+            elif (self.is_active):
+                if (self._log_handler is None): TracedException.print_current_stack_trace()
+                else: self._log_handler.error(handled_exception, context = "pas_server")
+            #
+        finally:
+            self.stop()
+
+            self._selector.close()
+
+            for _socket in self._wakeup_sockets: _socket.close()
+        #
+    #
+
+    def start(self):
+        """
+Starts the prepared dispatcher in a new thread.
+
+:since: v1.1.0
+        """
+
+        if (not self.is_active):
+            is_already_active = False
+
+            with self._lock:
+                # Thread safety
+                is_already_active = self.is_active
+                if (not is_already_active): self._active = True
+            #
+
+            if (not is_already_active):
+                Thread(target = self.run).start()
+            #
+        #
+    #
+
+    def _start_listening(self):
+        """
+Try to start listening on the prepared socket. Uses the defined startup
+timeout to wait for the socket to become available before throwing an
+exception.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except,raising-bad-type
+
+        _exception = None
+        timeout_time = (time.time() + self._listener_startup_timeout)
+
+        while (time.time() < timeout_time):
+            try:
+                if (_exception is not None): time.sleep(0.2)
+                _exception = None
+
+                self._listener_socket.listen(self._backlog_max)
+
+                break
+            except Exception as handled_exception: _exception = handled_exception
+        #
+
+        if (_exception is not None): raise _exception
+    #
+
+    def stop(self):
+        """
+Stops the listener and unqueues all running sockets.
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        self._lock.acquire()
+
+        if (self.is_active):
+            if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.stop()- (#echo(__LINE__)#)", self, context = "pas_server")
+
+            self._active = False
+
+            if (self.stopping_hook is not None and len(self.stopping_hook) > 0): Hook.unregister(self.stopping_hook, self.thread_stop)
+            self.stopping_hook = ""
+
+            self._lock.release()
+
+            if (self._wakeup_sockets is not None):
+                try: self._wakeup_sockets[1].send(b"\x00")
+                except socket.error: pass
+            #
+
+            self._remove_all_sockets()
+            self._worker_pool.stop()
+
+            unix_socket_path_name = (self._listener_socket.getsockname()
+                                     if (self._listener_socket.family == AF_UNIX) else
+                                     None
+                                    )
+
+            try: self._listener_socket.close()
+            finally:
+                if (unix_socket_path_name is not None):
+                    try: SelectorsDispatcher._remove_unixsocket(unix_socket_path_name)
+                    except Exception: pass
+                #
+            #
+        else: self._lock.release()
+    #
+#
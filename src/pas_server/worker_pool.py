@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+from threading import Condition, Lock
+
+from dpt_logging import LogLine
+from dpt_threading.thread import Thread
+
+class WorkerPool(object):
+    """
+The worker pool executes submitted tasks on a fixed number of reusable
+threads. Tasks waiting for a worker are held in a queue bounded by
+"queue_max" that is handled according to the overflow policy defined.
+Tasks submitted with the same key are executed one after another in the
+order submitted.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: server
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=broad-except
+
+    OVERFLOW_BLOCK = 2
+    """
+Block the submitting thread until the queue has space again.
+    """
+    OVERFLOW_DROP_OLDEST = 1
+    """
+Discard the oldest queued task to make room for the new one.
+    """
+    OVERFLOW_REJECT = 0
+    """
+Reject the new task if the queue is full.
+    """
+
+    __slots__ = [ "__weakref__",
+                  "_active",
+                  "_condition",
+                  "_keys_pending",
+                  "_overflow_policy",
+                  "_queue",
+                  "_queue_size",
+                  "_queue_condition",
+                  "_queue_max",
+                  "_workers",
+                  "_workers_max"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, workers_max, queue_max = 0, overflow_policy = OVERFLOW_REJECT):
+        """
+Constructor __init__(WorkerPool)
+
+:param workers_max: Number of worker threads
+:param queue_max: Maximum number of queued tasks; 0 for an unbounded queue
+:param overflow_policy: Policy applied if the queue is full
+
+:since: v1.1.0
+        """
+
+        lock = Lock()
+
+        self._active = False
+        """
+Worker pool state
+        """
+        self._condition = Condition(lock)
+        """
+Condition used to signal queued tasks
+        """
+        self._keys_pending = { }
+        """
+Tasks waiting for the completion of a previous task with the same key
+        """
+        self._overflow_policy = overflow_policy
+        """
+Policy applied if the queue is full
+        """
+        self._queue = deque()
+        """
+Queued tasks, their rejection callbacks and keys
+        """
+        self._queue_condition = Condition(lock)
+        """
+Condition used to signal free space in the queue
+        """
+        self._queue_max = (queue_max if (queue_max > 0) else 0)
+        """
+Maximum number of queued tasks
+        """
+        self._queue_size = 0
+        """
+Number of queued tasks including the ones waiting for their key
+        """
+        self._workers = [ ]
+        """
+Worker threads started
+        """
+        self._workers_max = (workers_max if (workers_max > 0) else 1)
+        """
+Number of worker threads
+        """
+    #
+
+    @property
+    def is_active(self):
+        """
+Returns the worker pool status.
+
+:return: (bool) True if active and accepting tasks
+:since:  v1.1.0
+        """
+
+        return self._active
+    #
+
+    @property
+    def queue_size(self):
+        """
+Returns the number of tasks waiting for a worker.
+
+:return: (int) Number of queued tasks
+:since:  v1.1.0
+        """
+
+        return self._queue_size
+    #
+
+    @property
+    def workers_max(self):
+        """
+Returns the number of worker threads.
+
+:return: (int) Number of worker threads
+:since:  v1.1.0
+        """
+
+        return self._workers_max
+    #
+
+    def _release_key(self, key):
+        """
+Queues the next task waiting for the given key or releases the key if
+none is left. The condition lock must be held by the caller.
+
+:param key: Task key
+
+:since: v1.1.0
+        """
+
+        tasks_pending = self._keys_pending[key]
+
+        if (len(tasks_pending) > 0):
+            self._queue.append(tasks_pending.popleft())
+            self._condition.notify()
+        else: del(self._keys_pending[key])
+    #
+
+    def _run_worker(self):
+        """
+Worker thread main loop executing queued tasks.
+
+:since: v1.1.0
+        """
+
+        while (True):
+            with self._condition:
+                while (self._active and len(self._queue) < 1): self._condition.wait()
+                if (not self._active): break
+
+                ( task, _, key ) = self._queue.popleft()
+
+                self._queue_size -= 1
+                self._queue_condition.notify()
+            #
+
+            try: task()
+            except Exception as handled_exception: LogLine.error(handled_exception, context = "pas_server")
+
+            del(task)
+
+            if (key is not None):
+                with self._condition:
+                    if (key in self._keys_pending): self._release_key(key)
+                #
+            #
+        #
+    #
+
+    def _reject(self, rejected_callback):
+        """
+Calls the rejection callback of a task not being executed.
+
+:param rejected_callback: Rejection callback; None if not defined
+
+:since: v1.1.0
+        """
+
+        if (rejected_callback is not None):
+            try: rejected_callback()
+            except Exception as handled_exception: LogLine.error(handled_exception, context = "pas_server")
+        #
+    #
+
+    def start(self):
+        """
+Starts the worker threads.
+
+:since: v1.1.0
+        """
+
+        with self._condition:
+            if (not self._active):
+                self._active = True
+
+                for _ in range(0, self._workers_max):
+                    worker = Thread(target = self._run_worker)
+                    worker.start()
+
+                    if (worker.is_alive()): self._workers.append(worker)
+                #
+
+                if (len(self._workers) < 1): self._active = False
+            #
+        #
+    #
+
+    def stop(self):
+        """
+Stops all worker threads after their current task. Queued tasks are
+discarded.
+
+:since: v1.1.0
+        """
+
+        with self._condition:
+            self._active = False
+
+            queue = self._queue
+            self._queue = deque()
+
+            for tasks_pending in self._keys_pending.values(): queue.extend(tasks_pending)
+
+            self._keys_pending = { }
+            self._queue_size = 0
+            self._workers = [ ]
+
+            self._condition.notify_all()
+            self._queue_condition.notify_all()
+        #
+
+        for ( _, rejected_callback, _ ) in queue: self._reject(rejected_callback)
+    #
+
+    def submit(self, task, rejected_callback = None, key = None):
+        """
+Queues the given callable for execution by a worker thread. The rejection
+callback is called for tasks that will not be executed because the queue
+is full or the pool has been stopped.
+
+:param task: Callable to be executed
+:param rejected_callback: Callable to be called if the task is discarded
+:param key: Hashable key; tasks with the same key are not executed
+            concurrently but in the order submitted
+
+:return: (bool) True if queued
+:since:  v1.1.0
+        """
+
+        _return = False
+        dropped_callback = None
+
+        with self._condition:
+            if (self._active and self._queue_max > 0 and self._queue_size >= self._queue_max):
+                if (self._overflow_policy == WorkerPool.OVERFLOW_BLOCK):
+                    while (self._active and self._queue_size >= self._queue_max): self._queue_condition.wait()
+                elif (self._overflow_policy == WorkerPool.OVERFLOW_DROP_OLDEST and len(self._queue) > 0):
+                    ( _, dropped_callback, dropped_key ) = self._queue.popleft()
+                    self._queue_size -= 1
+
+                    if (dropped_key is not None): self._release_key(dropped_key)
+                #
+            #
+
+            if (self._active and (self._queue_max < 1 or self._queue_size < self._queue_max)):
+                if (key is None): self._queue.append(( task, rejected_callback, None ))
+                elif (key in self._keys_pending): self._keys_pending[key].append(( task, rejected_callback, key ))
+                else:
+                    self._keys_pending[key] = deque()
+                    self._queue.append(( task, rejected_callback, key ))
+                #
+
+                self._queue_size += 1
+                self._condition.notify()
+
+                _return = True
+            #
+        #
+
+        if (dropped_callback is not None): self._reject(dropped_callback)
+        if (not _return): self._reject(rejected_callback)
+
+        return _return
+    #
+#
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import active_count, Thread
+from time import sleep
+import socket
+import unittest
+
+from dpt_module_loader import NamedClassLoader
+
+from pas_server.abstract_dispatcher import AbstractDispatcher
+from pas_server.aio_dispatcher import AioDispatcher
+from pas_server.controller import AbstractAioConnection
+
+_LOG_HANDLER = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+"""
+Log handler singleton kept alive for the weak references of dispatchers
+"""
+
+class _Request(object):
+    """
+Coroutine request echoing a fixed size message.
+
+:since: v1.1.0
+    """
+
+    def __init__(self, connection):
+        """
+Constructor __init__(_Request)
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        self.connection = connection
+    #
+
+    async def execute(self):
+        """
+Echoes a fixed size message with a vectored write.
+
+:since: v1.1.0
+        """
+
+        data = await self.connection.get_data(5, True)
+        await self.connection.write_data_vectored([ b"echo:", data ])
+    #
+
+    def init(self, connection):
+        """
+Initializes the request.
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+#
+
+class _Connection(AbstractAioConnection):
+    """
+Native coroutine connection handling echo requests.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    def _new_request(self):
+        """
+Initializes a new request instance for this connection.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return _Request(self)
+    #
+#
+
+class TestAioConnection(unittest.TestCase):
+    """
+UnitTest for AbstractAioConnection handled by AioDispatcher
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Starts the dispatcher.
+
+:since: v1.1.0
+        """
+
+        listener_socket = AbstractDispatcher.prepare_socket(socket.AF_INET, "127.0.0.1", 0)
+
+        self.address = listener_socket.getsockname()
+        self.dispatcher = AioDispatcher(listener_socket, _Connection, 4, 16)
+        self.dispatcher.start()
+
+        sleep(0.2)
+    #
+
+    def tearDown(self):
+        """
+Stops the dispatcher.
+
+:since: v1.1.0
+        """
+
+        self.dispatcher.stop()
+    #
+
+    def _connect(self):
+        """
+Returns a new client connected to the dispatcher.
+
+:return: (object) Client socket
+:since:  v1.1.0
+        """
+
+        _return = socket.create_connection(self.address)
+        _return.settimeout(5)
+
+        return _return
+    #
+
+    def test_concurrent_connections(self):
+        """
+Tests that concurrent connections are handled on the event loop without
+starting a thread per connection.
+
+:since: v1.1.0
+        """
+
+        clients = [ self._connect() for _ in range(0, 50) ]
+        threads_count = active_count()
+
+        try:
+            for ( position, client ) in enumerate(clients): client.sendall(b"x%04d" % position)
+            sleep(0.1)
+
+            self.assertLessEqual(active_count(), threads_count)
+
+            self.assertEqual([ b"echo:x%04d" % position for position in range(0, 50) ],
+                             [ client.recv(100) for client in clients ]
+                            )
+        finally:
+            for client in clients: client.close()
+        #
+    #
+
+    def test_data_received_in_parts(self):
+        """
+Tests waiting for data received in separate parts.
+
+:since: v1.1.0
+        """
+
+        client = self._connect()
+
+        try:
+            client.sendall(b"ab")
+
+            sender = Thread(target = lambda: (sleep(0.1), client.sendall(b"cde")))
+            sender.start()
+
+            self.assertEqual(b"echo:abcde", client.recv(100))
+            sender.join()
+        finally: client.close()
+    #
+
+    def test_eof_before_data_size(self):
+        """
+Tests that the connection is closed if the peer closes its side before the
+expected data size has been received.
+
+:since: v1.1.0
+        """
+
+        client = self._connect()
+
+        try:
+            client.sendall(b"ab")
+            client.shutdown(socket.SHUT_WR)
+
+            self.assertEqual(b"", client.recv(100))
+        finally: client.close()
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import socket
+import unittest
+
+from dpt_settings import Settings
+
+from pas_server.aio_multi_process_dispatcher import AioMultiProcessDispatcher
+from pas_server.controller import AbstractAioConnection
+
+def _exit_with_setting():
+    """
+Exits the process with the value of the test setting as exit code.
+
+:since: v1.1.0
+    """
+
+    raise SystemExit(Settings.get("pas_server_test_process_setting", 1))
+#
+
+@unittest.skipUnless(hasattr(socket, "SO_REUSEPORT"), "SO_REUSEPORT is not supported")
+class TestAioMultiProcessDispatcher(unittest.TestCase):
+    """
+UnitTest for AioMultiProcessDispatcher
+
+:since: v1.1.0
+    """
+
+    def tearDown(self):
+        """
+Removes the settings set by the tests.
+
+:since: v1.1.0
+        """
+
+        settings_dict = Settings.get_dict()
+        settings_dict.pop("pas_global_server_process_start_method", None)
+        settings_dict.pop("pas_server_test_process_setting", None)
+    #
+
+    def test_worker_inherits_settings(self):
+        """
+Tests that worker processes are forked and inherit runtime settings even if
+another start method is configured.
+
+:since: v1.1.0
+        """
+
+        Settings.set("pas_global_server_process_start_method", "spawn")
+        Settings.set("pas_server_test_process_setting", 0)
+
+        dispatcher = AioMultiProcessDispatcher(socket.AF_INET, ( "127.0.0.1", 0 ), AbstractAioConnection, 1)
+
+        process = dispatcher._process_context.Process(target = _exit_with_setting)
+        process.start()
+        process.join(10)
+
+        self.assertEqual(0, process.exitcode)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import unittest
+
+from dpt_settings import Settings
+
+from pas_server.controller import ConnectionSettings
+
+class TestConnectionSettings(unittest.TestCase):
+    """
+UnitTest for ConnectionSettings
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Sets a global setting used by the tests.
+
+:since: v1.1.0
+        """
+
+        Settings.set("pas_server_test_connection_settings", "global")
+    #
+
+    def tearDown(self):
+        """
+Removes the global setting used by the tests.
+
+:since: v1.1.0
+        """
+
+        Settings.get_dict().pop("pas_server_test_connection_settings", None)
+    #
+
+    def test_copy_on_write(self):
+        """
+Tests that values set are only visible to the instance they are set for.
+
+:since: v1.1.0
+        """
+
+        settings = ConnectionSettings()
+        other_settings = ConnectionSettings()
+
+        self.assertEqual("global", settings['pas_server_test_connection_settings'])
+
+        settings['pas_server_test_connection_settings'] = "connection"
+
+        self.assertEqual("connection", settings['pas_server_test_connection_settings'])
+        self.assertEqual("global", other_settings['pas_server_test_connection_settings'])
+        self.assertEqual("global", Settings.get("pas_server_test_connection_settings"))
+
+        del(settings['pas_server_test_connection_settings'])
+        self.assertEqual("global", settings['pas_server_test_connection_settings'])
+
+        self.assertRaises(KeyError, settings.__delitem__, "pas_server_test_connection_settings")
+    #
+
+    def test_global_changes(self):
+        """
+Tests that global settings changed later are visible to existing instances.
+
+:since: v1.1.0
+        """
+
+        settings = ConnectionSettings()
+
+        Settings.set("pas_server_test_connection_settings", "changed")
+
+        self.assertEqual("changed", settings['pas_server_test_connection_settings'])
+        self.assertIn("pas_server_test_connection_settings", settings)
+        self.assertIn("pas_server_test_connection_settings", list(settings))
+    #
+
+    def test_is_setting_enabled(self):
+        """
+Tests parsing boolean settings configured as bools or strings.
+
+:since: v1.1.0
+        """
+
+        for value in ( True, 1, "1", "t", "true", "True", " yes " ):
+            Settings.set("pas_server_test_connection_settings", value)
+            self.assertTrue(ConnectionSettings.is_setting_enabled("pas_server_test_connection_settings"), repr(value))
+        #
+
+        for value in ( False, 0, "0", "f", "false", "no", "" ):
+            Settings.set("pas_server_test_connection_settings", value)
+            self.assertFalse(ConnectionSettings.is_setting_enabled("pas_server_test_connection_settings", True), repr(value))
+        #
+
+        self.assertFalse(ConnectionSettings.is_setting_enabled("pas_server_test_undefined"))
+        self.assertTrue(ConnectionSettings.is_setting_enabled("pas_server_test_undefined", True))
+    #
+
+    def test_stacked_dicts(self):
+        """
+Tests that stacked dicts added are only visible to the instance they are
+added to.
+
+:since: v1.1.0
+        """
+
+        settings = ConnectionSettings()
+        other_settings = ConnectionSettings()
+
+        stacked_dict = { "pas_server_test_connection_settings": "stacked", "pas_server_test_stacked": 1 }
+        settings.add_dict(stacked_dict, True)
+
+        self.assertIsInstance(settings.stacked_dicts, list)
+        self.assertEqual("stacked", settings['pas_server_test_connection_settings'])
+        self.assertEqual(1, settings.get("pas_server_test_stacked"))
+
+        self.assertEqual("global", other_settings['pas_server_test_connection_settings'])
+        self.assertNotIn("pas_server_test_stacked", other_settings)
+        self.assertNotIn(stacked_dict, other_settings.stacked_dicts)
+
+        settings.stacked_dicts.append({ "pas_server_test_appended": True })
+        self.assertTrue(settings['pas_server_test_appended'])
+        self.assertNotIn("pas_server_test_appended", other_settings)
+
+        settings.remove_dict(stacked_dict)
+
+        self.assertEqual("global", settings['pas_server_test_connection_settings'])
+        self.assertNotIn("pas_server_test_stacked", settings)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Thread
+import asyncio
+import unittest
+
+from pas_server.controller import AbstractAioConnection, AbstractConnection, AbstractInnerRequest, AbstractRequest, AbstractResponse
+
+class _Response(AbstractResponse):
+    """
+Response not sending anything.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    def send(self):
+        """
+Sends the prepared response.
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+#
+
+class _InnerRequest(AbstractInnerRequest):
+    """
+Inner request without an implementation.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+#
+
+class _Request(AbstractRequest):
+    """
+Request recording the current instances while executed.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "callback", "connection", "results" ]
+
+    def __init__(self, callback):
+        """
+Constructor __init__(_Request)
+
+:param callback: Callback returning the response initialized
+
+:since: v1.1.0
+        """
+
+        AbstractRequest.__init__(self)
+
+        self.callback = callback
+        self.connection = None
+        self.results = [ ]
+    #
+
+    def execute(self):
+        """
+Initializes a response and records the current instances.
+
+:since: v1.1.0
+        """
+
+        response = self.callback(self)
+
+        self.results.append(AbstractRequest.get_instance() is self)
+        self.results.append(AbstractResponse.get_instance() is response)
+    #
+
+    def init(self, connection_or_request):
+        """
+Initializes default values from the a connection or request instance.
+
+:param connection_or_request: Connection or request instance
+
+:since: v1.1.0
+        """
+
+        AbstractRequest.init(self, connection_or_request)
+        self.connection = connection_or_request
+    #
+#
+
+class _AioRequest(_Request):
+    """
+Coroutine request recording the current instances while executed.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    async def execute(self):
+        """
+Initializes a response and records the current instances after other tasks
+have been executed.
+
+:since: v1.1.0
+        """
+
+        response = self.callback(self)
+        await asyncio.sleep(0.01)
+
+        self.results.append(AbstractRequest.get_instance() is self)
+        self.results.append(AbstractResponse.get_instance() is response)
+    #
+#
+
+class _Connection(AbstractConnection):
+    """
+Connection handling a given request.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "exceptions", "request" ]
+
+    def __init__(self, request):
+        """
+Constructor __init__(_Connection)
+
+:param request: Request to handle
+
+:since: v1.1.0
+        """
+
+        AbstractConnection.__init__(self)
+
+        self.exceptions = [ ]
+        self.request = request
+    #
+
+    def handle_execution_exception(self, exception):
+        """
+Records the exception thrown while handling a request.
+
+:since: v1.1.0
+        """
+
+        self.exceptions.append(exception)
+    #
+
+    def _new_request(self):
+        """
+Returns the request to handle.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return self.request
+    #
+#
+
+class _AioConnection(AbstractAioConnection):
+    """
+Coroutine connection handling a given request.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "request" ]
+
+    def __init__(self, request):
+        """
+Constructor __init__(_AioConnection)
+
+:param request: Request to handle
+
+:since: v1.1.0
+        """
+
+        AbstractAioConnection.__init__(self)
+
+        self.request = request
+    #
+
+    def finish(self):
+        """
+Finish transmission and cleanup resources.
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+
+    def _new_request(self):
+        """
+Returns the request to handle.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return self.request
+    #
+#
+
+class TestContextScopes(unittest.TestCase):
+    """
+UnitTest for the current request and response of the executing context
+
+:since: v1.1.0
+    """
+
+    def _handle(self, callback):
+        """
+Handles a request initializing a response with the given callback.
+
+:param callback: Callback returning the response initialized
+
+:return: (list) Results recorded by the request
+:since:  v1.1.0
+        """
+
+        request = _Request(callback)
+        connection = _Connection(request)
+
+        connection.handle()
+
+        self.assertEqual([ ], connection.exceptions)
+        self.assertIsNone(AbstractRequest.get_instance())
+        self.assertIsNone(AbstractResponse.get_instance())
+
+        return request.results
+    #
+
+    @staticmethod
+    def _init_response(connection_or_request):
+        """
+Returns a new response initialized from the given connection or request.
+
+:param connection_or_request: Connection or request instance
+
+:return: (object) Response object
+:since:  v1.1.0
+        """
+
+        _return = _Response()
+        _return.init(connection_or_request)
+
+        return _return
+    #
+
+    def test_aio_connections(self):
+        """
+Tests that concurrent coroutine requests see their own current instances.
+
+:since: v1.1.0
+        """
+
+        requests = [ _AioRequest(TestContextScopes._init_response) for _ in range(0, 5) ]
+
+        async def _handle_all():
+            await asyncio.gather(*[ _AioConnection(request).handle() for request in requests ])
+        #
+
+        asyncio.run(_handle_all())
+
+        for request in requests: self.assertEqual([ True, True ], request.results)
+    #
+
+    def test_nested_scopes(self):
+        """
+Tests that the current instances of an enclosing scope are restored after
+a request has been handled.
+
+:since: v1.1.0
+        """
+
+        outer_request = _Request(None)
+        outer_response = _Response()
+
+        outer_scope_token = outer_request.enter_scope()
+        outer_response_scope_token = outer_response.enter_scope()
+
+        try:
+            request = _Request(TestContextScopes._init_response)
+            _Connection(request).handle()
+
+            self.assertEqual([ True, True ], request.results)
+            self.assertIs(outer_request, AbstractRequest.get_instance())
+            self.assertIs(outer_response, AbstractResponse.get_instance())
+        finally:
+            outer_response.exit_scope(outer_response_scope_token)
+            outer_request.exit_scope(outer_scope_token)
+        #
+
+        self.assertIsNone(AbstractRequest.get_instance())
+        self.assertIsNone(AbstractResponse.get_instance())
+    #
+
+    def test_response_for_connection(self):
+        """
+Tests that a response initialized from the connection is the current one.
+
+:since: v1.1.0
+        """
+
+        results = self._handle(lambda request: TestContextScopes._init_response(request.connection))
+        self.assertEqual([ True, True ], results)
+    #
+
+    def test_response_for_inner_request(self):
+        """
+Tests that a response initialized from an inner request is the current
+one.
+
+:since: v1.1.0
+        """
+
+        def _init_inner_response(request):
+            inner_request = _InnerRequest()
+            inner_request.init(request)
+
+            return TestContextScopes._init_response(inner_request)
+        #
+
+        results = self._handle(_init_inner_response)
+        self.assertEqual([ True, True ], results)
+    #
+
+    def test_response_for_request(self):
+        """
+Tests that a response initialized from the request is the current one.
+
+:since: v1.1.0
+        """
+
+        results = self._handle(TestContextScopes._init_response)
+        self.assertEqual([ True, True ], results)
+    #
+
+    def test_threads(self):
+        """
+Tests that requests handled in other threads do not change the current
+instances.
+
+:since: v1.1.0
+        """
+
+        outer_response = _Response()
+        outer_response_scope_token = outer_response.enter_scope()
+
+        try:
+            request = _Request(TestContextScopes._init_response)
+
+            thread = Thread(target = _Connection(request).handle)
+            thread.start()
+            thread.join(5)
+
+            self.assertEqual([ True, True ], request.results)
+            self.assertIs(outer_response, AbstractResponse.get_instance())
+        finally: outer_response.exit_scope(outer_response_scope_token)
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
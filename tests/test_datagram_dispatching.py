@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+from threading import Lock
+from time import sleep, time
+import socket
+import unittest
+import warnings
+
+from dpt_module_loader import NamedClassLoader
+from dpt_settings import Settings
+
+from pas_server.controller import AbstractThreadDispatchedConnection
+from pas_server.selectors_dispatcher import SelectorsDispatcher
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    try: from pas_server.asyncore_dispatcher import AsyncoreDispatcher
+    except ImportError: AsyncoreDispatcher = None
+#
+
+_LOG_HANDLER = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+"""
+Log handler singleton kept alive for the weak references of dispatchers
+"""
+
+class _Request(object):
+    """
+Request replying to the datagram received after a delay.
+
+:since: v1.1.0
+    """
+
+    lock = Lock()
+    """
+Lock used to protect the class level records
+    """
+    running = { }
+    """
+Number of requests running per peer
+    """
+    overlaps = [ ]
+    """
+Datagrams received while another one of the same peer has been handled
+    """
+    received = [ ]
+    """
+Datagrams received in the order handled
+    """
+
+    def __init__(self, connection):
+        """
+Constructor __init__(_Request)
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        self.connection = connection
+    #
+
+    def execute(self):
+        """
+Replies to the datagram received after a delay.
+
+:since: v1.1.0
+        """
+
+        address = self.connection._client_socket_address
+        data = self.connection.get_data(65535)
+
+        with _Request.lock:
+            _Request.running[address] = _Request.running.get(address, 0) + 1
+            if (_Request.running[address] > 1): _Request.overlaps.append(data)
+        #
+
+        sleep(0.1)
+
+        with _Request.lock:
+            _Request.running[address] -= 1
+            _Request.received.append(data)
+        #
+
+        self.connection.socket.sendto(b"ok:" + data + b":" + self.connection.get_data(65535), address)
+    #
+
+    def init(self, connection):
+        """
+Initializes the request.
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+#
+
+class _Connection(AbstractThreadDispatchedConnection):
+    """
+Threaded connection handling datagram requests.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    def _new_request(self):
+        """
+Initializes a new request instance for this connection.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return _Request(self)
+    #
+#
+
+class _DatagramDispatchingTestMixin(object):
+    """
+Tests for concurrent datagram processing shared by all dispatchers.
+
+:since: v1.1.0
+    """
+
+    dispatcher_class = None
+    """
+Dispatcher class tested
+    """
+
+    def setUp(self):
+        """
+Resets the records of handled datagrams.
+
+:since: v1.1.0
+        """
+
+        _Request.overlaps = [ ]
+        _Request.received = [ ]
+        _Request.running = { }
+
+        self.clients = [ ]
+        self.dispatcher = None
+    #
+
+    def tearDown(self):
+        """
+Closes all clients, stops the dispatcher and removes settings set by the
+test.
+
+:since: v1.1.0
+        """
+
+        for client in self.clients: client.close()
+        if (self.dispatcher is not None): self.dispatcher.stop()
+
+        settings_dict = Settings.get_dict()
+        settings_dict.pop("pas_global_server_datagram_concurrent", None)
+        settings_dict.pop("pas_global_server_datagram_peer_ordered", None)
+    #
+
+    def _get_client(self):
+        """
+Returns a new datagram client socket.
+
+:return: (object) Client socket
+:since:  v1.1.0
+        """
+
+        _return = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        _return.settimeout(5)
+
+        self.clients.append(_return)
+
+        return _return
+    #
+
+    def _receive_replies(self, client, count):
+        """
+Returns the given number of replies received by the client.
+
+:param client: Client socket
+:param count: Number of replies
+
+:return: (list) Replies received
+:since:  v1.1.0
+        """
+
+        return [ client.recv(100) for _ in range(0, count) ]
+    #
+
+    def _start_dispatcher(self, concurrent, peer_ordered = False):
+        """
+Starts a dispatcher for a datagram listener.
+
+:param concurrent: Value of "pas_global_server_datagram_concurrent"
+:param peer_ordered: Value of "pas_global_server_datagram_peer_ordered"
+
+:return: (tuple) Listener address
+:since:  v1.1.0
+        """
+
+        Settings.set("pas_global_server_datagram_concurrent", concurrent)
+        Settings.set("pas_global_server_datagram_peer_ordered", peer_ordered)
+
+        listener_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        listener_socket.bind(( "127.0.0.1", 0 ))
+
+        self.dispatcher = self.__class__.dispatcher_class(listener_socket, _Connection, 4, 16)
+        self.dispatcher.start()
+
+        sleep(0.2)
+
+        return listener_socket.getsockname()
+    #
+
+    def test_datagrams_concurrent(self):
+        """
+Tests that datagrams are processed concurrently if enabled and that each
+connection only reads the datagram it has been initialized with.
+
+:since: v1.1.0
+        """
+
+        address = self._start_dispatcher(True)
+        clients = [ self._get_client() for _ in range(0, 4) ]
+
+        timestamp = time()
+        for ( position, client ) in enumerate(clients): client.sendto(b"d%d" % position, address)
+
+        replies = [ self._receive_replies(client, 1)[0] for client in clients ]
+
+        self.assertLess(time() - timestamp, 0.35)
+        self.assertEqual([ b"ok:d%d:" % position for position in range(0, 4) ], replies)
+    #
+
+    def test_datagrams_disabled_string(self):
+        """
+Tests that datagrams are processed one after another if concurrency is
+disabled with a string value.
+
+:since: v1.1.0
+        """
+
+        address = self._start_dispatcher("0")
+        clients = [ self._get_client() for _ in range(0, 3) ]
+
+        timestamp = time()
+        for ( position, client ) in enumerate(clients): client.sendto(b"d%d" % position, address)
+
+        for client in clients: self._receive_replies(client, 1)
+
+        self.assertGreaterEqual(time() - timestamp, 0.3)
+    #
+
+    def test_datagrams_peer_ordered(self):
+        """
+Tests that datagrams of the same peer are processed in the order received
+if enabled.
+
+:since: v1.1.0
+        """
+
+        address = self._start_dispatcher("true", "yes")
+        client = self._get_client()
+        other_client = self._get_client()
+
+        for position in range(0, 4):
+            client.sendto(b"a%d" % position, address)
+            other_client.sendto(b"b%d" % position, address)
+        #
+
+        self.assertEqual([ b"ok:a%d:" % position for position in range(0, 4) ], self._receive_replies(client, 4))
+        self.assertEqual([ b"ok:b%d:" % position for position in range(0, 4) ], self._receive_replies(other_client, 4))
+        self.assertEqual([ ], _Request.overlaps)
+    #
+#
+
+@unittest.skipIf(AsyncoreDispatcher is None, "asyncore is not available")
+class TestAsyncoreDatagramDispatching(_DatagramDispatchingTestMixin, unittest.TestCase):
+    """
+UnitTest for concurrent datagram processing of AsyncoreDispatcher
+
+:since: v1.1.0
+    """
+
+    dispatcher_class = AsyncoreDispatcher
+    """
+Dispatcher class tested
+    """
+#
+
+class TestSelectorsDatagramDispatching(_DatagramDispatchingTestMixin, unittest.TestCase):
+    """
+UnitTest for concurrent datagram processing of SelectorsDispatcher
+
+:since: v1.1.0
+    """
+
+    dispatcher_class = SelectorsDispatcher
+    """
+Dispatcher class tested
+    """
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
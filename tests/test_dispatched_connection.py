@@ -0,0 +1,630 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from socket import create_connection, socket, socketpair, AF_INET, SOCK_DGRAM
+from tempfile import TemporaryFile
+from threading import Thread, Timer
+from time import time
+import gzip
+import socket as socket_module
+import unittest
+
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.operation_not_supported_exception import OperationNotSupportedException
+from dpt_settings import Settings
+
+from pas_server.controller import AbstractDispatchedConnection, AbstractThreadDispatchedConnection, DispatchedStreamResponse, FileRangeStreamer
+
+class _Request(object):
+    """
+Request reading a line from the connection.
+
+:since: v1.1.0
+    """
+
+    def __init__(self, connection):
+        """
+Constructor __init__(_Request)
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        self.connection = connection
+    #
+
+    def execute(self):
+        """
+Reads a line from the connection.
+
+:since: v1.1.0
+        """
+
+        self.connection.readline()
+    #
+
+    def init(self, connection):
+        """
+Initializes the request.
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+#
+
+class _Connection(AbstractDispatchedConnection):
+    """
+Dispatched connection used to test reading and writing data.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+#
+
+class _FileRangeStreamer(FileRangeStreamer):
+    """
+File range streamer counting the calls to read data.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "read_count" ]
+
+    def __init__(self, _file, offset = 0, size = None):
+        """
+Constructor __init__(_FileRangeStreamer)
+
+:since: v1.1.0
+        """
+
+        FileRangeStreamer.__init__(self, _file, offset, size)
+
+        self.read_count = 0
+    #
+
+    def read(self, n = 65536):
+        """
+Counts the call and reads data.
+
+:since: v1.1.0
+        """
+
+        self.read_count += 1
+        return FileRangeStreamer.read(self, n)
+    #
+#
+
+class _GzipStreamer(gzip.GzipFile):
+    """
+Streamer decompressing data read from a gzip file.
+
+:since: v1.1.0
+    """
+
+    @property
+    def is_eof(self):
+        """
+Returns true if all data has been read.
+
+:return: (bool) True if EOF
+:since:  v1.1.0
+        """
+
+        return (len(self.peek(1)) < 1)
+    #
+#
+
+class _ThreadConnection(AbstractThreadDispatchedConnection):
+    """
+Threaded connection recording exceptions of handled requests.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "exceptions" ]
+
+    def __init__(self):
+        """
+Constructor __init__(_ThreadConnection)
+
+:since: v1.1.0
+        """
+
+        AbstractThreadDispatchedConnection.__init__(self)
+
+        self.exceptions = [ ]
+    #
+
+    def handle_execution_exception(self, exception):
+        """
+Records the exception thrown while handling a request.
+
+:since: v1.1.0
+        """
+
+        self.exceptions.append(exception)
+    #
+
+    def _new_request(self):
+        """
+Initializes a new request instance for this connection.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return _Request(self)
+    #
+#
+
+class TestDispatchedConnection(unittest.TestCase):
+    """
+UnitTest for the buffered reading and writing of AbstractDispatchedConnection
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Sets up a connection for one end of a socket pair.
+
+:since: v1.1.0
+        """
+
+        ( self.server_socket, self.client_socket ) = socketpair()
+
+        self.settings_set = [ ]
+        self.connection = None
+    #
+
+    def tearDown(self):
+        """
+Closes the socket pair and removes settings set by the test.
+
+:since: v1.1.0
+        """
+
+        self.server_socket.close()
+        self.client_socket.close()
+
+        settings_dict = Settings.get_dict()
+        for key in self.settings_set: settings_dict.pop(key, None)
+    #
+
+    def _get_connection(self, **settings):
+        """
+Returns a connection initialized with the given settings for the server end
+of the socket pair.
+
+:return: (object) Connection instance
+:since:  v1.1.0
+        """
+
+        for key in settings:
+            Settings.set(key, settings[key])
+            self.settings_set.append(key)
+        #
+
+        self.connection = _Connection()
+        self.connection.init_from_dispatcher(None, self.server_socket)
+
+        return self.connection
+    #
+
+    def _send_streamer(self, streamer, size):
+        """
+Sends the data of the given streamer with a stream response of a new
+connection.
+
+:param streamer: Streamer to send
+:param size: Bytes expected to be received
+
+:return: (bytes) Data received
+:since:  v1.1.0
+        """
+
+        response = DispatchedStreamResponse(self._get_connection())
+        response.streamer = streamer
+
+        ( receiver, chunks ) = self._start_receiver(size)
+
+        response.finish()
+        receiver.join(5)
+
+        return b"".join(chunks)
+    #
+
+    def _start_receiver(self, size):
+        """
+Starts a thread receiving the given number of bytes from the client end of
+the socket pair.
+
+:param size: Bytes to receive
+
+:return: (tuple) Receiver thread and list of data chunks received
+:since:  v1.1.0
+        """
+
+        chunks = [ ]
+        self.client_socket.settimeout(5)
+
+        def _receive():
+            received_size = 0
+
+            while (received_size < size):
+                data = self.client_socket.recv(65536)
+                if (len(data) < 1): break
+
+                chunks.append(data)
+                received_size += len(data)
+            #
+        #
+
+        _return = Thread(target = _receive)
+        _return.start()
+
+        return ( _return, chunks )
+    #
+
+    def test_get_frame(self):
+        """
+Tests reading frames written with "write_frame()".
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+
+        peer = _Connection()
+        peer.init_from_dispatcher(None, self.client_socket)
+
+        self.assertTrue(peer.write_frame(b"first"))
+        self.assertTrue(peer.write_frame(b""))
+        self.assertTrue(peer.write_frame(b"x" * 10000))
+
+        self.assertEqual(b"first", connection.get_frame().tobytes())
+        self.assertEqual(b"", connection.get_frame().tobytes())
+        self.assertEqual(10000, len(connection.get_frame()))
+
+        self.client_socket.sendall((3).to_bytes(2, "big") + b"abc" + (2).to_bytes(2, "big") + b"de")
+        self.client_socket.close()
+
+        self.assertEqual([ b"abc", b"de" ], [ frame.tobytes() for frame in connection.get_frames(2) ])
+    #
+
+    def test_get_frame_max_size(self):
+        """
+Tests that frames exceeding the maximum size are rejected.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+
+        self.client_socket.sendall((1024).to_bytes(4, "big"))
+        self.assertRaises(IOException, connection.get_frame, max_size = 1023)
+    #
+
+    def test_keep_alive_not_threaded(self):
+        """
+Tests that keep-alive is not enabled for connections not executed in a
+separate thread.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection(pas_global_server_keep_alive = True)
+        self.assertFalse(connection.keep_alive)
+
+        connection.keep_alive = True
+        self.assertFalse(connection.keep_alive)
+    #
+
+    def test_read_until(self):
+        """
+Tests reading data up to a delimiter received in separate chunks.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+
+        self.client_socket.sendall(b"first\r")
+        Timer(0.1, self.client_socket.sendall, ( b"\nsecond\r\nrest", )).start()
+
+        self.assertEqual(b"first\r\n", connection.read_until(b"\r\n"))
+        self.assertEqual(b"second\r\n", connection.read_until(b"\r\n"))
+
+        self.client_socket.close()
+        self.assertEqual(b"rest", connection.read_until(b"\r\n"))
+    #
+
+    def test_read_until_max_size(self):
+        """
+Tests that data exceeding the maximum size before the delimiter is rejected.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+
+        self.client_socket.sendall(b"x" * 64)
+        self.assertRaises(IOException, connection.read_until, b"\n", 32)
+    #
+
+    def test_readline(self):
+        """
+Tests reading lines followed by data read with "get_data()".
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+
+        self.client_socket.sendall(b"line 1\nline 2\nabc")
+
+        self.assertEqual(b"line 1\n", connection.readline())
+        self.assertEqual(b"line 2\n", connection.readline())
+        self.assertEqual(b"abc", connection.get_data(3, True))
+
+        self.client_socket.close()
+        self.assertEqual(b"", connection.readline())
+    #
+
+    def test_request_timeout(self):
+        """
+Tests that a request not receiving data in the time available is aborted
+and the connection is not kept alive.
+
+:since: v1.1.0
+        """
+
+        for ( key, value ) in ( ( "pas_global_server_keep_alive", True ), ( "pas_global_server_request_timeout", 0.2 ) ):
+            Settings.set(key, value)
+            self.settings_set.append(key)
+        #
+
+        connection = _ThreadConnection()
+        connection.init_from_dispatcher(None, self.server_socket)
+
+        self.assertTrue(connection.keep_alive)
+
+        self.client_socket.sendall(b"incomplete")
+
+        timestamp = time()
+        connection._thread_run()
+
+        self.assertLess(time() - timestamp, 2)
+        self.assertEqual(1, len(connection.exceptions))
+        self.assertIsInstance(connection.exceptions[0], IOException)
+        self.assertFalse(connection.keep_alive)
+    #
+
+    def test_send_file_range(self):
+        """
+Tests that only the range reported by the streamer is sent without reading
+the data.
+
+:since: v1.1.0
+        """
+
+        data = bytes(range(0, 256)) * 1024
+
+        with TemporaryFile() as _file:
+            _file.write(data)
+            _file.flush()
+
+            streamer = _FileRangeStreamer(_file, 1000, 100000)
+            self.assertEqual(data[1000:101000], self._send_streamer(streamer, 100000))
+        #
+
+        self.assertTrue(streamer.is_eof)
+        self.assertEqual(0, streamer.read_count)
+    #
+
+    def test_send_transforming_streamer(self):
+        """
+Tests that streamers backed by regular files not reporting a raw file
+range are read.
+
+:since: v1.1.0
+        """
+
+        data = b"uncompressed data" * 1024
+
+        with TemporaryFile() as _file:
+            with gzip.GzipFile(fileobj = _file, mode = "wb") as gzip_file: gzip_file.write(data)
+            _file.seek(0)
+
+            streamer = _GzipStreamer(fileobj = _file, mode = "rb")
+            self.assertEqual(data, self._send_streamer(streamer, len(data)))
+        #
+    #
+
+    def test_stream_response_creation(self):
+        """
+Tests that stream responses are only created if enabled and only for
+stream sockets.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+        self.assertFalse(connection.is_supported("stream_response_creation"))
+
+        connection.stream_response_creation = True
+        self.assertTrue(connection.is_supported("stream_response_creation"))
+        self.assertIsInstance(connection.new_stream_response(), DispatchedStreamResponse)
+
+        with socket(AF_INET, SOCK_DGRAM) as datagram_socket:
+            datagram_connection = _Connection()
+            datagram_connection.init_from_dispatcher(None, datagram_socket)
+            datagram_connection.stream_response_creation = True
+
+            self.assertFalse(datagram_connection.is_supported("stream_response_creation"))
+            self.assertRaises(OperationNotSupportedException, datagram_connection.new_stream_response)
+        #
+    #
+
+    def test_write_coalesced(self):
+        """
+Tests that small writes are held back until flushed.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection(pas_global_server_write_buffer_size = 1024,
+                                          pas_global_server_write_buffer_timeout = 10
+                                         )
+
+        self.client_socket.settimeout(0.2)
+
+        self.assertTrue(connection.write_data(b"first "))
+        self.assertTrue(connection.write_data(b"second"))
+        self.assertRaises(socket_module.timeout, self.client_socket.recv, 100)
+
+        self.assertTrue(connection.write_data_vectored([ b" ", b"third" ]))
+        self.assertEqual(b"first second third", self.client_socket.recv(100))
+
+        self.assertTrue(connection.write_data(b"fourth"))
+        self.assertTrue(connection.flush())
+        self.assertEqual(b"fourth", self.client_socket.recv(100))
+    #
+
+    def test_write_coalesced_size(self):
+        """
+Tests that buffered data is written once it exceeds the write buffer size.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection(pas_global_server_write_buffer_size = 8,
+                                          pas_global_server_write_buffer_timeout = 10
+                                         )
+
+        self.client_socket.settimeout(5)
+
+        self.assertTrue(connection.write_data(b"1234"))
+        self.assertTrue(connection.write_data(b"5678"))
+        self.assertEqual(b"12345678", self.client_socket.recv(100))
+    #
+
+    def test_write_coalesced_timeout(self):
+        """
+Tests that buffered data is written once the write buffer timeout has
+passed.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection(pas_global_server_write_buffer_size = 1024,
+                                          pas_global_server_write_buffer_timeout = 0.1
+                                         )
+
+        self.client_socket.settimeout(5)
+
+        self.assertTrue(connection.write_data(b"data"))
+        self.assertEqual(b"data", self.client_socket.recv(100))
+    #
+
+    @unittest.skipUnless(hasattr(socket_module, "TCP_CORK"), "TCP_CORK is not available")
+    def test_write_cork_setting(self):
+        """
+Tests that "TCP_CORK" is only used if enabled with a boolean value.
+
+:since: v1.1.0
+        """
+
+        Settings.set("pas_global_server_write_buffer_size", 1024)
+        Settings.set("pas_global_server_write_buffer_timeout", 10)
+        self.settings_set += [ "pas_global_server_write_buffer_size", "pas_global_server_write_buffer_timeout" ]
+
+        with socket(AF_INET) as listener_socket:
+            listener_socket.bind(( "127.0.0.1", 0 ))
+            listener_socket.listen(1)
+
+            with create_connection(listener_socket.getsockname()):
+                ( tcp_socket, _ ) = listener_socket.accept()
+
+                with tcp_socket:
+                    for ( value, expected ) in ( ( "false", False ), ( "0", False ), ( "true", True ), ( 1, True ) ):
+                        Settings.set("pas_global_server_write_tcp_cork", value)
+                        self.settings_set.append("pas_global_server_write_tcp_cork")
+
+                        connection = _Connection()
+                        connection.init_from_dispatcher(None, tcp_socket)
+                        connection.write_data(b"x")
+
+                        self.assertEqual(expected, connection._write_corked)
+                        connection.flush()
+                    #
+                #
+            #
+        #
+    #
+
+    def test_write_data_vectored(self):
+        """
+Tests writing buffers of different types exceeding the socket buffer
+size in one call.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+        buffers = [ b"a", b"", bytearray(b"b" * 1048576), memoryview(b"c" * 5), "d" ]
+        data = b"a" + (b"b" * 1048576) + b"ccccc" + b"d"
+
+        ( receiver, chunks ) = self._start_receiver(len(data))
+
+        self.assertTrue(connection.write_data_vectored(buffers))
+        receiver.join(5)
+
+        self.assertEqual(data, b"".join(chunks))
+    #
+
+    def test_write_data_vectored_iov_max(self):
+        """
+Tests writing more buffers than allowed for a single "sendmsg()" call.
+
+:since: v1.1.0
+        """
+
+        connection = self._get_connection()
+        buffers = [ b"%05d" % position for position in range(0, 3 * AbstractDispatchedConnection.IOV_MAX + 1) ]
+        data = b"".join(buffers)
+
+        ( receiver, chunks ) = self._start_receiver(len(data))
+
+        self.assertTrue(connection.write_data_vectored(buffers))
+        receiver.join(5)
+
+        self.assertEqual(data, b"".join(chunks))
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import unittest
+
+from pas_server.controller import AbstractInnerRequest, AbstractRequest
+
+class _InnerRequest(AbstractInnerRequest):
+    """
+Inner request not inheriting chained parameters.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+#
+
+class _ChainedInnerRequest(AbstractInnerRequest):
+    """
+Inner request inheriting chained parameters.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    _parameters_chained_inherited_ = True
+#
+
+class TestInnerRequest(unittest.TestCase):
+    """
+UnitTest for the layered parameters of AbstractInnerRequest
+
+:since: v1.1.0
+    """
+
+    def test_chained_parameters(self):
+        """
+Tests that chained parameters are only inherited if enabled.
+
+:since: v1.1.0
+        """
+
+        parent = _InnerRequest()
+        parent.set_parameter_chained("chained", 1)
+
+        request = _InnerRequest()
+        request.init(parent)
+
+        self.assertIsNone(request.get_parameter_chained("chained"))
+
+        request = _ChainedInnerRequest()
+        request.init(parent)
+
+        self.assertEqual(1, request.get_parameter_chained("chained"))
+    #
+
+    def test_parameters_layered(self):
+        """
+Tests that parameters are inherited from all parents without modifying
+them.
+
+:since: v1.1.0
+        """
+
+        request = AbstractRequest()
+        request.update_parameters({ "a": 1, "b": 2 })
+
+        inner_request = _InnerRequest()
+        inner_request.init(request)
+        inner_request.set_parameter("b", 3)
+
+        nested_request = _InnerRequest()
+        nested_request.init(inner_request)
+        nested_request.set_parameter("c", 4)
+
+        self.assertEqual(1, nested_request.get_parameter("a"))
+        self.assertEqual(3, nested_request.get_parameter("b"))
+        self.assertEqual(4, nested_request.get_parameter("c"))
+        self.assertEqual(3, len(nested_request.parameters))
+
+        self.assertEqual(2, request.get_parameter("b"))
+        self.assertIsNone(inner_request.get_parameter("c"))
+
+        nested_request.unset_parameter("a")
+
+        self.assertIsNone(nested_request.get_parameter("a"))
+        self.assertEqual(1, inner_request.get_parameter("a"))
+        self.assertEqual(1, request.get_parameter("a"))
+    #
+
+    def test_parameters_setter(self):
+        """
+Tests that parameters set are copied.
+
+:since: v1.1.0
+        """
+
+        parameters = { "a": 1 }
+
+        request = _InnerRequest()
+        request.parameters = parameters
+        parameters['a'] = 2
+
+        self.assertEqual(1, request.get_parameter("a"))
+
+        request.parameters = { }
+        self.assertEqual(0, len(request.parameters))
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
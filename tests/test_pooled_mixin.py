@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Thread
+import unittest
+
+from dpt_settings import Settings
+
+from pas_server.controller import PooledMixin
+
+class _Pooled(PooledMixin):
+    """
+Pooled class counting resets.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ "__weakref__", "reset_count" ] + PooledMixin._mixin_slots_
+
+    def __init__(self):
+        """
+Constructor __init__(_Pooled)
+
+:since: v1.1.0
+        """
+
+        self.reset_count = 0
+    #
+
+    def reset(self):
+        """
+Counts the reset.
+
+:since: v1.1.0
+        """
+
+        self.reset_count += 1
+    #
+#
+
+class TestPooledMixin(unittest.TestCase):
+    """
+UnitTest for PooledMixin
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Clears the pool of the current thread.
+
+:since: v1.1.0
+        """
+
+        _Pooled._get_pool().clear()
+    #
+
+    def tearDown(self):
+        """
+Clears the pool of the current thread and removes settings set by the test.
+
+:since: v1.1.0
+        """
+
+        _Pooled._get_pool().clear()
+
+        settings_dict = Settings.get_dict()
+        settings_dict.pop("pas_global_server_object_pool_debug", None)
+        settings_dict.pop("pas_global_server_object_pool_size_max", None)
+    #
+
+    def test_acquire_released(self):
+        """
+Tests that released instances are reset and reused.
+
+:since: v1.1.0
+        """
+
+        instance = _Pooled.acquire()
+        instance.release()
+
+        self.assertEqual(1, instance.reset_count)
+        self.assertIs(instance, _Pooled.acquire())
+        self.assertIsNot(instance, _Pooled.acquire())
+    #
+
+    def test_debug_mode_setting(self):
+        """
+Tests that acquired instances are only tracked if debug mode is enabled
+with a boolean value.
+
+:since: v1.1.0
+        """
+
+        Settings.set("pas_global_server_object_pool_debug", "false")
+        instance = _Pooled.acquire()
+        self.assertNotIn(id(instance), PooledMixin._pool_outstanding)
+        instance.release()
+
+        Settings.set("pas_global_server_object_pool_debug", "true")
+        instance = _Pooled.acquire()
+        self.assertIn(id(instance), PooledMixin._pool_outstanding)
+        instance.release()
+        self.assertNotIn(id(instance), PooledMixin._pool_outstanding)
+    #
+
+    def test_pool_size_max_setting(self):
+        """
+Tests that no more released instances are kept than configured.
+
+:since: v1.1.0
+        """
+
+        Settings.set("pas_global_server_object_pool_size_max", "1")
+
+        instances = [ _Pooled.acquire(), _Pooled.acquire() ]
+        for instance in instances: instance.release()
+
+        self.assertEqual([ instances[0] ], _Pooled._get_pool())
+    #
+
+    def test_pools_per_thread(self):
+        """
+Tests that instances released are only reused by the same thread.
+
+:since: v1.1.0
+        """
+
+        instance = _Pooled.acquire()
+        instance.release()
+
+        acquired = [ ]
+
+        thread = Thread(target = lambda: acquired.append(_Pooled.acquire()))
+        thread.start()
+        thread.join(5)
+
+        self.assertIsNot(instance, acquired[0])
+        self.assertIs(instance, _Pooled.acquire())
+    #
+
+    def test_release_twice(self):
+        """
+Tests that releasing an instance more than once does not put it into the
+pool again.
+
+:since: v1.1.0
+        """
+
+        instance = _Pooled.acquire()
+        instance.release()
+        instance.release()
+
+        self.assertEqual(1, instance.reset_count)
+        self.assertEqual(1, len(_Pooled._get_pool()))
+
+        self.assertIs(instance, _Pooled.acquire())
+        self.assertIsNot(instance, _Pooled.acquire())
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import sleep, time
+import socket
+import unittest
+
+from dpt_module_loader import NamedClassLoader
+from dpt_settings import Settings
+
+from pas_server.abstract_dispatcher import AbstractDispatcher
+from pas_server.controller import AbstractThreadDispatchedConnection
+from pas_server.selectors_dispatcher import SelectorsDispatcher
+
+_LOG_HANDLER = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+"""
+Log handler singleton kept alive for the weak references of dispatchers
+"""
+
+class _Request(object):
+    """
+Request sending a greeting if configured and echoing the data received.
+
+:since: v1.1.0
+    """
+
+    def __init__(self, connection):
+        """
+Constructor __init__(_Request)
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        self.connection = connection
+    #
+
+    def execute(self):
+        """
+Echoes the data received.
+
+:since: v1.1.0
+        """
+
+        if (Settings.get("pas_server_test_greeting", False)): self.connection.write_data(b"hello\n")
+
+        data = self.connection.get_data(1024)
+        self.connection.write_data(b"echo:" + data)
+    #
+
+    def init(self, connection):
+        """
+Initializes the request.
+
+:param connection: Connection instance
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+#
+
+class _Connection(AbstractThreadDispatchedConnection):
+    """
+Threaded connection handling echo requests.
+
+:since: v1.1.0
+    """
+
+    __slots__ = [ ]
+
+    def _new_request(self):
+        """
+Initializes a new request instance for this connection.
+
+:return: (object) Request object
+:since:  v1.1.0
+        """
+
+        return _Request(self)
+    #
+#
+
+class TestSelectorsDispatcher(unittest.TestCase):
+    """
+UnitTest for SelectorsDispatcher
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Sets up the lists of clients and settings to clean up.
+
+:since: v1.1.0
+        """
+
+        self.clients = [ ]
+        self.dispatcher = None
+        self.settings_set = [ ]
+    #
+
+    def tearDown(self):
+        """
+Closes all clients, stops the dispatcher and removes settings set by the
+test.
+
+:since: v1.1.0
+        """
+
+        for client in self.clients: client.close()
+        if (self.dispatcher is not None): self.dispatcher.stop()
+
+        settings_dict = Settings.get_dict()
+        for key in self.settings_set: settings_dict.pop(key, None)
+    #
+
+    def _connect(self):
+        """
+Returns a new client connected to the dispatcher.
+
+:return: (object) Client socket
+:since:  v1.1.0
+        """
+
+        _return = socket.create_connection(self.dispatcher._listener_socket.getsockname())
+        _return.settimeout(5)
+
+        self.clients.append(_return)
+
+        return _return
+    #
+
+    def _start_dispatcher(self, threads_active = 1, backlog_max = 10, **settings):
+        """
+Starts a dispatcher with the given settings.
+
+:param threads_active: Allowed simultaneous threads
+:param backlog_max: Allowed queued connections waiting for a thread
+
+:since: v1.1.0
+        """
+
+        for key in settings:
+            Settings.set(key, settings[key])
+            self.settings_set.append(key)
+        #
+
+        listener_socket = AbstractDispatcher.prepare_socket(socket.AF_INET, "127.0.0.1", 0)
+
+        self.dispatcher = SelectorsDispatcher(listener_socket, _Connection, threads_active, backlog_max)
+        self.dispatcher.start()
+
+        for _ in range(0, 100):
+            if (self.dispatcher._selector is not None and len(self.dispatcher._selector.get_map()) > 1): break
+            sleep(0.01)
+        #
+    #
+
+    def test_connection_settings(self):
+        """
+Tests that connection settings are read once by the dispatcher.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(pas_global_server_keep_alive = "true")
+        Settings.set("pas_global_server_keep_alive", False)
+
+        self.assertTrue(self.dispatcher.connection_settings['keep_alive'])
+
+        client = self._connect()
+
+        client.sendall(b"first")
+        self.assertEqual(b"echo:first", client.recv(100))
+
+        client.sendall(b"second")
+        self.assertEqual(b"echo:second", client.recv(100))
+    #
+
+    def test_dispatch_immediately(self):
+        """
+Tests that connections of protocols where the server sends data first are
+activated immediately if dispatching on readable is disabled.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(pas_global_server_dispatch_on_readable = "false",
+                               pas_server_test_greeting = True
+                              )
+
+        client = self._connect()
+
+        self.assertEqual(b"hello\n", client.recv(6))
+
+        client.sendall(b"abc")
+        self.assertEqual(b"echo:abc", client.recv(100))
+    #
+
+    def test_echo(self):
+        """
+Tests handling concurrent connections.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(4, 20)
+
+        clients = [ self._connect() for _ in range(0, 10) ]
+
+        for ( position, client ) in enumerate(clients): client.sendall(b"x%d" % position)
+
+        self.assertEqual([ b"echo:x%d" % position for position in range(0, 10) ],
+                         [ client.recv(100) for client in clients ]
+                        )
+    #
+
+    def test_idle_connections(self):
+        """
+Tests that idle connections do not occupy a worker thread.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher()
+
+        idle_clients = [ self._connect() for _ in range(0, 3) ]
+        sleep(0.1)
+
+        client = self._connect()
+        client.sendall(b"abc")
+
+        self.assertEqual(b"echo:abc", client.recv(100))
+
+        idle_clients[0].sendall(b"late")
+        self.assertEqual(b"echo:late", idle_clients[0].recv(100))
+    #
+
+    def test_idle_connections_backlog(self):
+        """
+Tests that idle connections count against the backlog.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(backlog_max = 2)
+
+        self._connect()
+        self._connect()
+        sleep(0.1)
+
+        client = self._connect()
+
+        try: data = client.recv(100)
+        except ConnectionResetError: data = b""
+
+        self.assertEqual(b"", data)
+        self.assertEqual(2, len(self.dispatcher._parked_sockets))
+    #
+
+    def test_idle_connections_timeout(self):
+        """
+Tests that idle connections are closed after the socket data timeout.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(global_server_socket_data_timeout = 1)
+
+        client = self._connect()
+        timestamp = time()
+
+        try: data = client.recv(100)
+        except ConnectionResetError: data = b""
+
+        self.assertEqual(b"", data)
+        self.assertLess(time() - timestamp, 3)
+        self.assertEqual(0, len(self.dispatcher._parked_sockets))
+    #
+
+    def test_keep_alive(self):
+        """
+Tests handling successive requests on the same socket if keep-alive is
+enabled.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(pas_global_server_keep_alive = "1",
+                               pas_global_server_keep_alive_requests_max = 2
+                              )
+
+        client = self._connect()
+
+        client.sendall(b"first")
+        self.assertEqual(b"echo:first", client.recv(100))
+
+        client.sendall(b"second")
+        self.assertEqual(b"echo:second", client.recv(100))
+
+        self.assertEqual(b"", client.recv(100))
+    #
+
+    def test_keep_alive_disabled_string(self):
+        """
+Tests that the socket is closed after the first request if keep-alive is
+disabled with a string value.
+
+:since: v1.1.0
+        """
+
+        self._start_dispatcher(pas_global_server_keep_alive = "false")
+
+        client = self._connect()
+
+        client.sendall(b"first")
+        self.assertEqual(b"echo:first", client.recv(100))
+        self.assertEqual(b"", client.recv(100))
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
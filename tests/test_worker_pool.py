@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;server
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasServerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Event, Lock, Thread
+from time import sleep
+import unittest
+
+from pas_server.worker_pool import WorkerPool
+
+class TestWorkerPool(unittest.TestCase):
+    """
+UnitTest for WorkerPool
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Sets up an unstarted worker pool reference and the event blocking the
+first task.
+
+:since: v1.1.0
+        """
+
+        self.pool = None
+        self.release_event = Event()
+        self.started_event = Event()
+    #
+
+    def tearDown(self):
+        """
+Releases blocked tasks and stops the worker pool.
+
+:since: v1.1.0
+        """
+
+        self.release_event.set()
+        if (self.pool is not None): self.pool.stop()
+    #
+
+    def _block(self):
+        """
+Task blocking the worker until the release event is set.
+
+:since: v1.1.0
+        """
+
+        self.started_event.set()
+        self.release_event.wait(5)
+    #
+
+    def _start_blocked_pool(self, overflow_policy):
+        """
+Starts a pool with one worker blocked by a running task and one task
+queued.
+
+:param overflow_policy: Worker pool overflow policy
+
+:return: (list) Names of the tasks executed and rejected
+:since:  v1.1.0
+        """
+
+        results = [ ]
+
+        self.pool = WorkerPool(1, 1, overflow_policy)
+        self.pool.start()
+
+        self.assertTrue(self.pool.submit(self._block))
+        self.assertTrue(self.started_event.wait(5))
+
+        self.assertTrue(self.pool.submit(lambda: results.append("queued"), lambda: results.append("queued rejected")))
+        self.assertEqual(1, self.pool.queue_size)
+
+        return results
+    #
+
+    def _wait_for_empty_queue(self):
+        """
+Waits until all queued tasks have been picked up by a worker.
+
+:since: v1.1.0
+        """
+
+        for _ in range(0, 500):
+            if (self.pool.queue_size < 1): break
+            sleep(0.01)
+        #
+
+        sleep(0.05)
+    #
+
+    def test_keyed_ordering(self):
+        """
+Tests that tasks with the same key are executed one after another in the
+order submitted while other keys are executed concurrently.
+
+:since: v1.1.0
+        """
+
+        lock = Lock()
+        results = { "a": [ ], "b": [ ] }
+        running = { "a": 0, "b": 0 }
+        overlaps = [ ]
+
+        def _task(key, position):
+            with lock:
+                running[key] += 1
+                if (running[key] > 1): overlaps.append(( key, position ))
+            #
+
+            sleep(0.005)
+
+            with lock:
+                running[key] -= 1
+                results[key].append(position)
+            #
+        #
+
+        self.pool = WorkerPool(4)
+        self.pool.start()
+
+        for position in range(0, 20):
+            self.assertTrue(self.pool.submit(lambda position = position: _task("a", position), key = "a"))
+            self.assertTrue(self.pool.submit(lambda position = position: _task("b", position), key = "b"))
+        #
+
+        for _ in range(0, 500):
+            with lock:
+                if (len(results['a']) + len(results['b']) >= 40): break
+            #
+
+            sleep(0.01)
+        #
+
+        self.assertEqual([ ], overlaps)
+        self.assertEqual(list(range(0, 20)), results['a'])
+        self.assertEqual(list(range(0, 20)), results['b'])
+    #
+
+    def test_overflow_block(self):
+        """
+Tests that a full queue blocks the submitter until space is available.
+
+:since: v1.1.0
+        """
+
+        results = self._start_blocked_pool(WorkerPool.OVERFLOW_BLOCK)
+        submit_results = [ ]
+
+        submitter = Thread(target = lambda: submit_results.append(self.pool.submit(lambda: results.append("overflow"))))
+        submitter.start()
+
+        submitter.join(0.2)
+        self.assertTrue(submitter.is_alive())
+
+        self.release_event.set()
+        submitter.join(5)
+
+        self.assertEqual([ True ], submit_results)
+
+        self._wait_for_empty_queue()
+        self.assertEqual([ "queued", "overflow" ], results)
+    #
+
+    def test_overflow_drop_oldest(self):
+        """
+Tests that the oldest queued task is rejected for a new one if the queue is
+full.
+
+:since: v1.1.0
+        """
+
+        results = self._start_blocked_pool(WorkerPool.OVERFLOW_DROP_OLDEST)
+
+        self.assertTrue(self.pool.submit(lambda: results.append("overflow"), lambda: results.append("overflow rejected")))
+        self.assertEqual([ "queued rejected" ], results)
+
+        self.release_event.set()
+        self._wait_for_empty_queue()
+
+        self.assertEqual([ "queued rejected", "overflow" ], results)
+    #
+
+    def test_overflow_reject(self):
+        """
+Tests that new tasks are rejected if the queue is full.
+
+:since: v1.1.0
+        """
+
+        results = self._start_blocked_pool(WorkerPool.OVERFLOW_REJECT)
+
+        self.assertFalse(self.pool.submit(lambda: results.append("overflow"), lambda: results.append("overflow rejected")))
+        self.assertEqual([ "overflow rejected" ], results)
+
+        self.release_event.set()
+        self._wait_for_empty_queue()
+
+        self.assertEqual([ "overflow rejected", "queued" ], results)
+    #
+
+    def test_stop_rejects_queued(self):
+        """
+Tests that queued tasks are rejected if the pool is stopped.
+
+:since: v1.1.0
+        """
+
+        results = [ ]
+
+        self.pool = WorkerPool(1)
+        self.pool.start()
+
+        self.assertTrue(self.pool.submit(self._block))
+        self.assertTrue(self.started_event.wait(5))
+
+        self.assertTrue(self.pool.submit(lambda: results.append("queued"), lambda: results.append("queued rejected")))
+
+        self.pool.stop()
+        self.assertEqual([ "queued rejected" ], results)
+
+        self.assertFalse(self.pool.submit(lambda: results.append("stopped"), lambda: results.append("stopped rejected")))
+        self.assertEqual([ "queued rejected", "stopped rejected" ], results)
+    #
+
+    def test_workers_max(self):
+        """
+Tests that no more tasks than worker threads are executed concurrently.
+
+:since: v1.1.0
+        """
+
+        lock = Lock()
+        running = [ 0 ]
+        running_max = [ 0 ]
+        results = [ ]
+
+        def _task(position):
+            with lock:
+                running[0] += 1
+                running_max[0] = max(running_max[0], running[0])
+            #
+
+            sleep(0.01)
+
+            with lock:
+                running[0] -= 1
+                results.append(position)
+            #
+        #
+
+        self.pool = WorkerPool(2)
+        self.pool.start()
+
+        self.assertEqual(2, self.pool.workers_max)
+
+        for position in range(0, 10): self.assertTrue(self.pool.submit(lambda position = position: _task(position)))
+        self._wait_for_empty_queue()
+
+        for _ in range(0, 500):
+            with lock:
+                if (len(results) >= 10): break
+            #
+
+            sleep(0.01)
+        #
+
+        self.assertEqual(list(range(0, 10)), sorted(results))
+        self.assertEqual(2, running_max[0])
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#